@@ -283,6 +283,7 @@ class Config:
     NEWS_MAX_CHARS: int = 1000
 
     # Runtime Info (Not saved in env)
+    # API名 -> src.utils.api_stats.QuotaInfo（str() で "Remaining: X / Limit: Y" 表記）
     QUOTA_INFO = {}
 
 
@@ -245,16 +245,13 @@ def cmd_category(args):
 
     print(f"\nRAW API RESULTS ({len(videos)} 件):")
 
-    # フィルタ適用
+    # 重複排除 → フィルタ適用 → 信頼チャンネルでソート
     exclude_filters = get_youtube_exclude_filters(category)
-    filter_result = filter_instance.apply_filters(videos, exclude_filters)
+    filter_result = filter_instance.filter_pipeline(videos, exclude_filters)
 
     kept = filter_result["kept"]
     removed = filter_result["removed"]
 
-    # 信頼チャンネルでソート
-    kept = filter_instance.sort_trusted(kept)
-
     for idx, video in enumerate(kept, 1):
         print_video(idx, video, "kept")
 
@@ -314,6 +314,11 @@ def get_channel_info(channel_id: str) -> dict:
     )
 
 
+def get_trusted_channel_info(channel_id: str) -> dict | None:
+    """信頼チャンネルならメタデータを、そうでなければNoneを返す（判定と取得を1回の参照で行う）"""
+    return TRUSTED_CHANNELS.get(channel_id)
+
+
 def get_channel_display_name(channel_id: str, fallback_name: str = "Unknown") -> str:
     """チャンネルIDから表示名を取得（信頼チャンネルならその名前、そうでなければフォールバック）"""
     info = TRUSTED_CHANNELS.get(channel_id)
@@ -44,6 +44,9 @@ YOUTUBE_SEARCH_SPECS: dict[str, dict[str, Any]] = {
         "window": {
             "days_before": 365,  # キックオフの何日前から（1年に短縮）
             "offset_hours": 24,  # キックオフの24時間前まで（ネタバレ防止）
+            # 期間を何分割して検索するか（1=分割なし）
+            # 増やすと古い動画まで拾えるが、分割数×100ユニットのクォータを消費する
+            "bins": 1,
         },
         "exclude_filters": ["live_stream", "press_conference", "reaction"],
         # playlist方式: UNEXT・チーム公式・リーグ・放送局
@@ -161,6 +164,27 @@ def get_youtube_time_window(
     return published_after, published_before
 
 
+def get_youtube_time_windows(
+    category: str, kickoff_time: datetime
+) -> list[tuple[datetime, datetime]]:
+    """
+    時間ウィンドウをスペックの bins 数に等分割して返す
+
+    Args:
+        category: 検索カテゴリ
+        kickoff_time: キックオフ時刻（UTC）
+
+    Returns:
+        [(published_after, published_before), ...]（古い順、bins=1なら1要素）
+    """
+    published_after, published_before = get_youtube_time_window(category, kickoff_time)
+    bins = max(1, YOUTUBE_SEARCH_SPECS[category]["window"].get("bins", 1))
+
+    step = (published_before - published_after) / bins
+    edges = [published_after + step * i for i in range(bins)] + [published_before]
+    return list(zip(edges[:-1], edges[1:], strict=True))
+
+
 def get_youtube_allowed_channel_categories(category: str) -> list[str]:
     """カテゴリの許可チャンネルカテゴリリストを取得"""
     spec = YOUTUBE_SEARCH_SPECS.get(category)
@@ -88,8 +88,15 @@ class CacheWarmer:
         return result
 
 
-def run_cache_warming(remaining_quota: int) -> dict:
-    """キャッシュウォーミングを実行するエントリーポイント"""
+def get_cache_warming_skip_reason() -> str | None:
+    """
+    キャッシュウォーミングをスキップすべき理由を返す
+
+    クォータ確認（HTTP）より前に判定できる条件のみを扱う。
+
+    Returns:
+        スキップ理由（実行可能な場合はNone）
+    """
     import os
 
     # Check if cache warming is enabled via environment variable
@@ -98,15 +105,28 @@ def run_cache_warming(remaining_quota: int) -> dict:
     )
     if not cache_warming_enabled:
         logger.info("Cache warming skipped: CACHE_WARMING_ENABLED is False")
-        return {"skipped": True, "reason": "disabled"}
+        return "disabled"
 
     if config.USE_MOCK_DATA:
         logger.info("Cache warming skipped: mock mode")
-        return {"skipped": True, "reason": "mock_mode"}
+        return "mock_mode"
+
+    if config.DEBUG_MODE:
+        logger.info("Cache warming skipped: debug mode")
+        return "debug_mode"
 
     if CACHE_BACKEND != "gcs":
         logger.info("Cache warming skipped: GCS backend not enabled")
-        return {"skipped": True, "reason": "no_gcs"}
+        return "no_gcs"
+
+    return None
+
+
+def run_cache_warming(remaining_quota: int) -> dict:
+    """キャッシュウォーミングを実行するエントリーポイント"""
+    skip_reason = get_cache_warming_skip_reason()
+    if skip_reason:
+        return {"skipped": True, "reason": skip_reason}
 
     warmer = CacheWarmer()
     return warmer.run(remaining_quota)
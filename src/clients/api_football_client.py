@@ -3,7 +3,7 @@ from typing import Any
 
 from config import config
 from src.clients.caching_http_client import create_caching_client
-from src.utils.api_stats import ApiStats
+from src.utils.api_stats import ApiStats, QuotaInfo
 
 logger = logging.getLogger(__name__)
 
@@ -174,14 +174,17 @@ class ApiFootballClient:
 
             remaining = response.headers["x-ratelimit-requests-remaining"]
             limit = response.headers.get("x-ratelimit-requests-limit", "Unknown")
-            info = f"Remaining: {remaining} / Limit: {limit} (requests/day)"
-            config.QUOTA_INFO["API-Football"] = info
             self.quota_info = {"remaining": remaining, "limit": limit}
 
-            # ApiStatsにクォータ情報を記録
+            # 数値化したクォータを config.QUOTA_INFO と ApiStats に記録
             try:
                 remaining_int = int(remaining)
-                limit_int = int(limit) if limit != "Unknown" else 7500
-                ApiStats.set_quota("API-Football", remaining_int, limit_int)
+                limit_int = int(limit) if limit != "Unknown" else None
             except (ValueError, TypeError):
-                pass
+                return
+            config.QUOTA_INFO["API-Football"] = QuotaInfo(remaining_int, limit_int)
+            ApiStats.set_quota(
+                "API-Football",
+                remaining_int,
+                limit_int if limit_int is not None else 7500,
+            )
@@ -19,6 +19,9 @@ _shared_gcs_client = None
 _shared_gcs_buckets = {}
 GCS_OPERATION_TIMEOUT_SECONDS = float(os.getenv("GCS_OPERATION_TIMEOUT_SECONDS", "20"))
 GCS_AUTH_TIMEOUT_SECONDS = float(os.getenv("GCS_AUTH_TIMEOUT_SECONDS", "10"))
+# キャッシュは機械読み取り専用のため、インデント・空白なしで保存してサイズを抑える
+# ensure_ascii=False は維持（日本語を \uXXXX にすると1文字6バイトに膨らむ）
+CACHE_JSON_SEPARATORS = (",", ":")
 
 
 class CacheStore(ABC):
@@ -92,9 +95,10 @@ class LocalCacheStore(CacheStore):
     def read(self, path: str) -> dict | None:
         cache_path = self._get_full_path(path)
         try:
-            if cache_path.exists():
-                with open(cache_path, encoding="utf-8") as f:
-                    return json.load(f)
+            with open(cache_path, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            pass
         except Exception as e:
             logger.warning(f"Failed to read local cache {cache_path}: {e}")
         return None
@@ -102,9 +106,14 @@ class LocalCacheStore(CacheStore):
     def write(self, path: str, data: dict) -> None:
         cache_path = self._get_full_path(path)
         try:
-            cache_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(cache_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            try:
+                f = open(cache_path, "w", encoding="utf-8")
+            except FileNotFoundError:
+                # サブディレクトリ未作成の初回のみ作成して再試行
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                f = open(cache_path, "w", encoding="utf-8")
+            with f:
+                json.dump(data, f, ensure_ascii=False, separators=CACHE_JSON_SEPARATORS)
             logger.debug(f"Cache saved to local: {cache_path}")
         except Exception as e:
             logger.warning(f"Failed to write local cache {cache_path}: {e}")
@@ -132,9 +141,13 @@ class GcsCacheStore(CacheStore):
         Args:
             bucket_name: GCSバケット名
         """
+        from google.api_core.exceptions import NotFound
+
         self.bucket_name = bucket_name
         self._client = None
         self._bucket = None
+        # 読み込み時の「キャッシュなし」判定用（毎回importしないよう保持）
+        self._not_found_error = NotFound
 
     def _get_bucket(self):
         """GCSバケットを遅延初期化して返す（プロセス内で共有）"""
@@ -176,9 +189,11 @@ class GcsCacheStore(CacheStore):
         try:
             bucket = self._get_bucket()
             blob = bucket.blob(path)
-            if blob.exists(timeout=GCS_OPERATION_TIMEOUT_SECONDS):
-                content = blob.download_as_text(timeout=GCS_OPERATION_TIMEOUT_SECONDS)
-                return json.loads(content)
+            # exists() を挟まず直接ダウンロードし、1往復で済ませる
+            content = blob.download_as_text(timeout=GCS_OPERATION_TIMEOUT_SECONDS)
+            return json.loads(content)
+        except self._not_found_error:
+            pass
         except Exception as e:
             logger.warning(f"Failed to read from GCS {path}: {e}")
         return None
@@ -188,7 +203,7 @@ class GcsCacheStore(CacheStore):
             bucket = self._get_bucket()
             blob = bucket.blob(path)
             blob.upload_from_string(
-                json.dumps(data, ensure_ascii=False, indent=2),
+                json.dumps(data, ensure_ascii=False, separators=CACHE_JSON_SEPARATORS),
                 content_type="application/json",
                 timeout=GCS_OPERATION_TIMEOUT_SECONDS,
             )
@@ -274,10 +274,11 @@ def create_caching_client(
     """
     from settings.cache_config import ENDPOINT_TTL_DAYS, USE_API_CACHE
     from src.clients.cache_store import create_cache_store
-    from src.clients.http_client import RequestsHttpClient
+    from src.clients.http_client import get_http_client
 
     store = create_cache_store(backend)
-    http_client = RequestsHttpClient()
+    # 共有HTTPクライアントを使い、クォータ確認・キャッシュウォーミングと接続プールを共有する
+    http_client = get_http_client()
 
     return CachingHttpClient(
         store=store,
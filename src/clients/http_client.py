@@ -9,15 +9,30 @@ from abc import ABC, abstractmethod
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
 from tenacity import (
     retry,
     retry_if_exception_type,
     stop_after_attempt,
     wait_exponential,
 )
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+# 接続プール設定
+# HTTP_POOL_CONNECTIONS: ホストごとのプールを保持する数（接続先は数ホストのみのため少なめ）
+# HTTP_POOL_MAXSIZE: 1ホストあたりに保持する接続数
+#   試合ごとのレポート生成やバックグラウンド処理が並列に同一ホストへ接続するため既定値(10)より広げる
+HTTP_POOL_CONNECTIONS = 4
+HTTP_POOL_MAXSIZE = 16
+
+# 一時的なサーバーエラー(5xx)はurllib3層でGETのみ再試行する
+# 接続エラー/タイムアウトは tenacity 側で再試行するため、ここでは connect/read=0
+HTTP_STATUS_RETRY_TOTAL = 3
+HTTP_STATUS_RETRY_BACKOFF = 0.5
+HTTP_STATUS_RETRY_FORCELIST = (502, 503, 504)
+
 
 class HttpResponse:
     """HTTPレスポンスの抽象化（requests.Response互換）"""
@@ -130,6 +145,27 @@ class HttpClient(ABC):
 class RequestsHttpClient(HttpClient):
     """requestsライブラリを使用するHTTPクライアント"""
 
+    def __init__(self):
+        # 接続プール付きSession（同一ホストへのTCP/TLS接続を再利用）
+        self.session = requests.Session()
+        status_retry = Retry(
+            total=HTTP_STATUS_RETRY_TOTAL,
+            connect=0,
+            read=0,
+            status=HTTP_STATUS_RETRY_TOTAL,
+            backoff_factor=HTTP_STATUS_RETRY_BACKOFF,
+            status_forcelist=HTTP_STATUS_RETRY_FORCELIST,
+            allowed_methods=("GET",),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_CONNECTIONS,
+            pool_maxsize=HTTP_POOL_MAXSIZE,
+            max_retries=status_retry,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=1, max=5),
@@ -149,7 +185,7 @@ class RequestsHttpClient(HttpClient):
         params: dict[str, Any] = None,
         timeout: int = 30,
     ) -> HttpResponse:
-        response = requests.get(
+        response = self.session.get(
             url, headers=headers or {}, params=params or {}, timeout=timeout
         )
         return HttpResponse(
@@ -180,7 +216,9 @@ class RequestsHttpClient(HttpClient):
         json: dict[str, Any] = None,
         timeout: int = 30,
     ) -> HttpResponse:
-        response = requests.post(url, headers=headers or {}, json=json, timeout=timeout)
+        response = self.session.post(
+            url, headers=headers or {}, json=json, timeout=timeout
+        )
         return HttpResponse(
             status_code=response.status_code,
             content=response.content,
@@ -5,9 +5,12 @@ YouTube Data API v3とのやり取りを一元化し、キャッシュ管理も
 ServiceはこのClientを通じてYouTube検索機能を使用する。
 """
 
+import concurrent.futures
 import hashlib
 import logging
 import os
+import threading
+from collections.abc import Callable
 from datetime import UTC, datetime, timedelta
 
 from config import config
@@ -24,6 +27,18 @@ class YouTubeSearchClient:
 
     API_BASE = "https://www.googleapis.com/youtube/v3"
 
+    # partial response: 結果の組み立てに使うフィールドのみ返させる（レスポンスサイズ削減）
+    SEARCH_FIELDS = (
+        "items(id/videoId,"
+        "snippet(title,description,channelId,channelTitle,publishedAt,"
+        "thumbnails/medium/url))"
+    )
+    PLAYLIST_FIELDS = (
+        "items(snippet(title,description,publishedAt,resourceId/videoId,"
+        "videoOwnerChannelId,videoOwnerChannelTitle,"
+        "thumbnails(medium/url,default/url)))"
+    )
+
     def __init__(
         self,
         api_key: str = None,
@@ -45,9 +60,26 @@ class YouTubeSearchClient:
         )
         self.cache_store = cache_store or create_cache_store()
 
-        # API呼び出し/キャッシュヒットカウンター
+        # API呼び出し/キャッシュヒットカウンター（並列検索に備えてロックで保護）
         self.api_call_count = 0
         self.cache_hit_count = 0
+        self._stats_lock = threading.Lock()
+
+        # プロセス内の取得結果（検索条件キー -> Future）。同じ実行で同じ条件の取得を繰り返さない
+        self._memo: dict[str, concurrent.futures.Future] = {}
+        self._memo_lock = threading.Lock()
+
+    def _record_api_call(self, api_name: str) -> None:
+        """API呼び出し回数を記録"""
+        with self._stats_lock:
+            self.api_call_count += 1
+        ApiStats.record_call(api_name)
+
+    def _record_cache_hit(self) -> None:
+        """キャッシュヒット回数を記録"""
+        with self._stats_lock:
+            self.cache_hit_count += 1
+        ApiStats.record_cache_hit("YouTube Data API")
 
     def _get_cache_path(
         self,
@@ -88,17 +120,15 @@ class YouTubeSearchClient:
             if cached_at_str:
                 cached_at = datetime.fromisoformat(cached_at_str)
                 if datetime.now() - cached_at < timedelta(days=ttl_days):
-                    logger.debug(f"YouTube cache HIT: {cache_path}")
-                    self.cache_hit_count += 1
-                    ApiStats.record_cache_hit("YouTube Data API")
+                    logger.debug("YouTube cache HIT: %s", cache_path)
+                    self._record_cache_hit()
                     return data.get("results", [])
                 else:
-                    logger.debug(f"YouTube cache expired: {cache_path}")
+                    logger.debug("YouTube cache expired: %s", cache_path)
             else:
                 # タイムスタンプがない場合は古い形式か無期限扱い
-                logger.debug(f"YouTube cache HIT (no timestamp): {cache_path}")
-                self.cache_hit_count += 1
-                ApiStats.record_cache_hit("YouTube Data API")
+                logger.debug("YouTube cache HIT (no timestamp): %s", cache_path)
+                self._record_cache_hit()
                 return data.get("results", [])
 
         except Exception as e:
@@ -106,6 +136,29 @@ class YouTubeSearchClient:
 
         return None
 
+    def _get_memoized(self, key: str, fetch: Callable[[], list[dict]]) -> list[dict]:
+        """
+        同じキーの取得結果をプロセス内で共有する（並列に要求された場合も取得は1回）
+
+        呼び出し側は動画辞書に category 等を書き込むため、辞書はコピーして返す。
+        """
+        with self._memo_lock:
+            future = self._memo.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = concurrent.futures.Future()
+                self._memo[key] = future
+
+        if is_owner:
+            try:
+                future.set_result(fetch())
+            except Exception as e:
+                future.set_exception(e)
+        else:
+            logger.debug("YouTube memo HIT: %s", key)
+
+        return [dict(v) for v in future.result()]
+
     def _write_cache(self, cache_path: str, results: list[dict]):
         """キャッシュに書き込み"""
         if not self.use_youtube_cache or not results:
@@ -117,7 +170,7 @@ class YouTubeSearchClient:
                 "results": results,
             }
             self.cache_store.write(cache_path, data)
-            logger.debug(f"YouTube cache saved: {cache_path}")
+            logger.debug("YouTube cache saved: %s", cache_path)
         except Exception as e:
             logger.warning(f"Failed to write YouTube cache {cache_path}: {e}")
 
@@ -146,7 +199,6 @@ class YouTubeSearchClient:
         Returns:
             動画情報のリスト
         """
-        # キャッシュチェック
         cache_path = self._get_cache_path(
             query,
             channel_id,
@@ -155,6 +207,35 @@ class YouTubeSearchClient:
             relevance_language,
             region_code,
         )
+
+        # 同一実行内で同じ条件の検索はキャッシュ/APIを再度引かずに結果を共有する
+        return self._get_memoized(
+            f"{cache_path}#{max_results}",
+            lambda: self._fetch_search(
+                cache_path,
+                query,
+                published_after,
+                published_before,
+                max_results,
+                relevance_language,
+                region_code,
+                channel_id,
+            ),
+        )
+
+    def _fetch_search(
+        self,
+        cache_path: str,
+        query: str,
+        published_after: datetime | None,
+        published_before: datetime | None,
+        max_results: int,
+        relevance_language: str | None,
+        region_code: str | None,
+        channel_id: str | None,
+    ) -> list[dict]:
+        """search.list の結果をキャッシュまたはAPIから取得"""
+        # キャッシュチェック
         cached = self._read_cache(cache_path)
         if cached is not None:
             return cached[:max_results]
@@ -166,6 +247,7 @@ class YouTubeSearchClient:
                 "key": self.api_key,
                 "q": query,
                 "part": "snippet",
+                "fields": self.SEARCH_FIELDS,
                 "type": "video",
                 "maxResults": max_results,
                 "order": "relevance",
@@ -214,8 +296,7 @@ class YouTubeSearchClient:
 
                 # キャッシュ保存
                 self._write_cache(cache_path, results)
-                self.api_call_count += 1
-                ApiStats.record_call("YouTube Data API")
+                self._record_api_call("YouTube Data API")
                 logger.info(
                     f"YouTube API: '{query}' -> {len(results)} results (API calls: {self.api_call_count})"
                 )
@@ -252,19 +333,32 @@ class YouTubeSearchClient:
         Returns:
             動画情報のリスト（search()と同じ形式）
         """
+        cache_path = f"youtube/playlist_{channel_id}_{published_after.strftime('%Y%m%d') if published_after else 'nodate'}.json"
+
+        # 同じチームの選手紹介やホーム/アウェイの戦術など、同一条件のプレイリストは1回だけ取得する
+        results = self._get_memoized(
+            cache_path,
+            lambda: self._fetch_playlist_videos(channel_id, cache_path, max_results),
+        )
+        return self._filter_by_date(results, published_after, published_before)
+
+    def _fetch_playlist_videos(
+        self, channel_id: str, cache_path: str, max_results: int
+    ) -> list[dict]:
+        """uploads playlistの動画をキャッシュまたはAPIから取得（日付フィルタ前）"""
         # uploads playlist ID = "UU" + channel_id[2:]
         playlist_id = "UU" + channel_id[2:]
-        cache_path = f"youtube/playlist_{channel_id}_{published_after.strftime('%Y%m%d') if published_after else 'nodate'}.json"
 
         cached = self._read_cache(cache_path)
         if cached is not None:
-            return self._filter_by_date(cached, published_after, published_before)
+            return cached
 
         try:
             url = f"{self.API_BASE}/playlistItems"
             params = {
                 "key": self.api_key,
                 "part": "snippet",
+                "fields": self.PLAYLIST_FIELDS,
                 "playlistId": playlist_id,
                 "maxResults": min(max_results, 50),
             }
@@ -299,12 +393,11 @@ class YouTubeSearchClient:
                     )
 
                 self._write_cache(cache_path, results)
-                self.api_call_count += 1
-                ApiStats.record_call("YouTube Playlist API")
+                self._record_api_call("YouTube Playlist API")
                 logger.info(
                     f"YouTube Playlist: channel={channel_id} -> {len(results)} videos"
                 )
-                return self._filter_by_date(results, published_after, published_before)
+                return results
             else:
                 logger.warning(
                     f"YouTube playlistItems failed: {response.status_code} for channel {channel_id}"
@@ -352,5 +445,6 @@ class YouTubeSearchClient:
 
     def reset_stats(self):
         """統計をリセット"""
-        self.api_call_count = 0
-        self.cache_hit_count = 0
+        with self._stats_lock:
+            self.api_call_count = 0
+            self.cache_hit_count = 0
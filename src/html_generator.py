@@ -5,6 +5,7 @@ HTMLレポートをpublic/reports/に配置する。
 責務: HTML生成に特化（CSS外部参照、manifest管理はManifestManagerへ委譲）
 """
 
+import concurrent.futures
 import logging
 import os
 from pathlib import Path
@@ -23,6 +24,9 @@ logger = logging.getLogger(__name__)
 REPORTS_DIR = "public/reports"
 CSS_PATH = "../assets/report_styles.css"
 
+# 試合ごとのHTML/選手プロフィール書き出しの最大並列数
+MAX_HTML_WORKERS = 8
+
 
 def sync_from_firebase() -> int:
     """
@@ -97,7 +101,17 @@ def generate_html_report(content: str, report_datetime: str = None) -> str:
     return output_path
 
 
-def generate_html_reports(report_list: list) -> list:
+def prefetch_remote_manifest(
+    executor: concurrent.futures.Executor,
+) -> concurrent.futures.Future:
+    """Firebase上のmanifest.json取得をexecutor上で先行開始する"""
+    return executor.submit(FirebaseSyncClient().fetch_manifest)
+
+
+def generate_html_reports(
+    report_list: list,
+    remote_manifest_future: concurrent.futures.Future | None = None,
+) -> list:
     """
     試合別レポートを複数HTMLファイルとして生成（新方式）
 
@@ -109,6 +123,8 @@ def generate_html_reports(report_list: list) -> list:
                 "image_paths": List[str],
                 "filename": str
             }, ...]
+        remote_manifest_future: prefetch_remote_manifest()で先行取得中のmanifest
+            （省略時はここで取得を開始する）
 
     Returns:
         生成されたHTMLファイルパスのリスト
@@ -119,25 +135,29 @@ def generate_html_reports(report_list: list) -> list:
     # 出力ディレクトリ作成
     Path(REPORTS_DIR).mkdir(parents=True, exist_ok=True)
 
+    # リモートmanifestの取得（ネットワーク待ち）をファイル書き出しと並行させる
+    manifest_manager = ManifestManager()
+    if remote_manifest_future is None:
+        fetch_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        remote_manifest_future = fetch_executor.submit(
+            manifest_manager.firebase_client.fetch_manifest
+        )
+        fetch_executor.shutdown(wait=False)
+
+    # 試合ごとのファイル書き出し（選手名翻訳のI/Oを含む）は独立しているため並列実行
+    # executor.map で入力順を維持する
     html_paths = []
+    if report_list:
+        max_workers = min(len(report_list), MAX_HTML_WORKERS)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            html_paths = list(executor.map(_write_report_files, report_list))
+
+    # manifest/カレンダーCSVの更新は共有ファイルの読み書きになるため逐次実行
     match_entries = []  # manifest用のエントリ
 
     for report in report_list:
         match = report["match"]
-        html_content = report["markdown_content"]  # Jinja2 でレンダリング済み
-        filename_base = report["filename"]
-
-        # HTMLファイル保存
-        html_filename = f"{filename_base}.html"
-        output_path = os.path.join(REPORTS_DIR, html_filename)
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(html_content)
-
-        # プロフィールHTML生成 (Issue #237)
-        write_player_profile_files(match, output_dir="public/player-profiles")
-
-        html_paths.append(output_path)
-        logger.info(f"Generated HTML: {output_path}")
+        html_filename = f"{report['filename']}.html"
 
         # manifest用エントリ
         match_entries.append(
@@ -173,14 +193,34 @@ def generate_html_reports(report_list: list) -> list:
                 )
 
     # manifest更新（日付グループ構造）
-    manifest_manager = ManifestManager()
-    manifest_manager.load_with_remote_merge()
+    manifest_manager.merge_remote(remote_manifest_future.result())
     manifest_manager.add_match_entries(match_entries, generation_datetime)
     manifest_manager.save()
 
     return html_paths
 
 
+def _write_report_files(report: dict) -> str:
+    """1試合分のレポートHTMLと選手プロフィールHTMLを書き出す
+
+    Returns:
+        レポートHTMLのパス
+    """
+    match = report["match"]
+    html_content = report["markdown_content"]  # Jinja2 でレンダリング済み
+
+    # HTMLファイル保存
+    output_path = os.path.join(REPORTS_DIR, f"{report['filename']}.html")
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write(html_content)
+
+    # プロフィールHTML生成 (Issue #237)
+    write_player_profile_files(match, output_dir="public/player-profiles")
+
+    logger.info(f"Generated HTML: {output_path}")
+    return output_path
+
+
 def _get_html_template(
     title: str, html_body: str, timestamp: str, mode_banner: str = ""
 ) -> str:
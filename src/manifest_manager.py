@@ -146,8 +146,18 @@ class ManifestManager:
         Returns:
             マージ済みmanifest辞書
         """
-        # リモートを取得
-        remote_manifest = self.firebase_client.fetch_manifest()
+        return self.merge_remote(self.firebase_client.fetch_manifest())
+
+    def merge_remote(self, remote_manifest: dict | None) -> dict:
+        """
+        取得済みのリモートmanifestとローカルをマージして読み込み
+
+        Args:
+            remote_manifest: FirebaseSyncClient.fetch_manifest()の戻り値（取得失敗時はNone）
+
+        Returns:
+            マージ済みmanifest辞書
+        """
         if remote_manifest:
             self._manifest["reports_by_date"] = remote_manifest.get(
                 "reports_by_date", {}
@@ -1,5 +1,9 @@
+import concurrent.futures
 import logging
 import re
+from html import escape
+
+import markdown as md_lib
 
 from config import config
 from src.domain.models import MatchAggregate
@@ -14,9 +18,14 @@ from src.parsers import (
     parse_key_player_text,
     parse_matchup_text,
 )
+from src.parsers.matchup_parser import PlayerMatchup
+from src.parsers.tactical_style_parser import parse_tactical_style_text
+from src.template_engine import render_template
 from src.utils.api_stats import ApiStats
 from src.utils.datetime_util import DateTimeUtil
 from src.utils.formation_image import get_formation_layout_data
+from src.utils.name_translator import NameTranslator
+from src.utils.nationality_flags import get_flag_emoji
 from src.utils.player_profile import build_player_profile_url
 
 logger = logging.getLogger(__name__)
@@ -25,6 +34,9 @@ logger = logging.getLogger(__name__)
 class ReportGenerator:
     WEB_IMAGE_DIR = "public/reports"
 
+    # 試合ごとのレポート並列生成の最大ワーカー数
+    MAX_REPORT_WORKERS = 8
+
     def __init__(self):
         self.player_formatter = PlayerFormatter()
         self.match_info_formatter = MatchInfoFormatter()
@@ -51,32 +63,56 @@ class ReportGenerator:
         # 各試合のレポートを生成
         generation_datetime = DateTimeUtil.format_filename_datetime()
 
-        report_list = []
         target_matches = [m for m in matches if m.core.is_target]
+        if not target_matches:
+            return []
 
-        for match in target_matches:
-            markdown_content, image_paths = self.generate_single_match(
-                match, youtube_videos, shared_debug_html
-            )
+        # 試合ごとのレポート生成（LLM/GCS I/O を含む）は独立しているため並列実行
+        # 全試合を submit してから result() を待ち、入力順を維持して返す
+        max_workers = min(len(target_matches), self.MAX_REPORT_WORKERS)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    self.generate_one,
+                    match,
+                    youtube_videos,
+                    shared_debug_html,
+                    generation_datetime,
+                )
+                for match in target_matches
+            ]
+            report_list = [future.result() for future in futures]
 
-            # MatchCore に get_report_filename があるか、MatchAggregate にあるか
-            # model.py を見ると MatchAggregate に実装されているのでそのまま
-            filename = match.get_report_filename(generation_datetime)
+        return report_list
 
-            report_list.append(
-                {
-                    "match": match,
-                    "markdown_content": markdown_content,
-                    "image_paths": image_paths,
-                    "filename": filename,
-                }
-            )
+    def generate_one(
+        self,
+        match: MatchAggregate,
+        youtube_videos: dict[str, list[dict]],
+        shared_debug_html: str,
+        generation_datetime: str,
+    ) -> dict:
+        """
+        1試合分のレポートを生成し、report_list の1要素を返す
+        """
+        markdown_content, image_paths = self.generate_single_match(
+            match, youtube_videos, shared_debug_html
+        )
 
-            logger.info(
-                f"Generated report for: {match.core.home_team} vs {match.core.away_team} -> {filename}"
-            )
+        # MatchCore に get_report_filename があるか、MatchAggregate にあるか
+        # model.py を見ると MatchAggregate に実装されているのでそのまま
+        filename = match.get_report_filename(generation_datetime)
 
-        return report_list
+        logger.info(
+            f"Generated report for: {match.core.home_team} vs {match.core.away_team} -> {filename}"
+        )
+
+        return {
+            "match": match,
+            "markdown_content": markdown_content,
+            "image_paths": image_paths,
+            "filename": filename,
+        }
 
     def generate_single_match(
         self,
@@ -90,10 +126,6 @@ class ReportGenerator:
         logger.info(
             f"[REPORT] Generating single match: {match.core.home_team} vs {match.core.away_team}"
         )
-        from config import config
-        from src.template_engine import render_template
-        from src.utils.name_translator import NameTranslator
-
         # デバッグ/モックモードの見出し設定
         mode_prefix = ""
         mode_banner = ""
@@ -105,8 +137,6 @@ class ReportGenerator:
             mode_banner = '<div class="mode-banner mode-banner-debug">🔧 DEBUG MODE - このレポートはデバッグ用です</div>'
 
         # 生成日時
-        from src.utils.datetime_util import DateTimeUtil
-
         timestamp = DateTimeUtil.format_display_timestamp()
 
         # 選手名をカタカナに変換（フォーメーション図の短縮名用にも必要）
@@ -147,8 +177,6 @@ class ReportGenerator:
 
     def _build_player_profile_modal_html(self, match: MatchAggregate) -> str:
         """選手プロフィールのモーダル HTML シェルを生成する。"""
-        from src.template_engine import render_template
-
         return render_template("partials/player_profile_modal.html")
 
     def _generate_shared_debug_section(
@@ -216,8 +244,6 @@ class ReportGenerator:
 
     def _format_form_details_table(self, form_details: list) -> str:
         """直近試合詳細テーブルをHTML形式で生成"""
-        from src.template_engine import render_template
-
         return render_template("partials/form_table.html", form_details=form_details)
 
     def _get_match_report_context(
@@ -232,11 +258,6 @@ class ReportGenerator:
         Returns:
             (context_dict, image_paths)
         """
-        import markdown as md_lib
-
-        from src.template_engine import render_template
-        from src.utils.name_translator import NameTranslator
-
         # コンテキストデータの準備
         image_paths = []
         # 選手名をカタカナに変換（フォーメーション図の短縮名用にも必要）
@@ -458,11 +479,9 @@ class ReportGenerator:
         # 予測セクション (Issue #199 分割配置)
         win_prediction_html = ""
         scorer_prediction_html = ""
-        from src.template_engine import render_template as render_partial
-
         if match.facts.prediction_percent:
             logger.info(f"Rendering win prediction section for {match.core.id}")
-            win_prediction_html = render_partial(
+            win_prediction_html = render_template(
                 "partials/win_prediction_section.html",
                 prediction_percent=match.facts.prediction_percent,
                 home_team=match.core.home_team,
@@ -475,7 +494,7 @@ class ReportGenerator:
 
         if match.facts.scorer_odds:
             logger.info(f"Rendering scorer prediction section for {match.core.id}")
-            scorer_prediction_html = render_partial(
+            scorer_prediction_html = render_template(
                 "partials/scorer_prediction_section.html",
                 scorer_odds=match.facts.scorer_odds,
             )
@@ -614,11 +633,6 @@ class ReportGenerator:
         self, match, md_lib, player_photos: dict = None, translator=None
     ) -> str:
         """戦術プレビュー内の各セクションを個別にビジュアル化して結合"""
-        import re
-
-        from src.parsers.tactical_style_parser import parse_tactical_style_text
-        from src.utils.name_translator import NameTranslator
-
         if player_photos is None:
             player_photos = match.facts.player_photos
 
@@ -822,12 +836,6 @@ class ReportGenerator:
         構造化データ(same_country_matchups)からPlayerMatchupリストを構築。
         説明文はllm_textから国ごとに抽出する。
         """
-        from html import escape
-
-        from src.parsers.matchup_parser import PlayerMatchup
-        from src.utils.name_translator import NameTranslator
-        from src.utils.nationality_flags import get_flag_emoji
-
         if translator is None:
             translator = NameTranslator()
 
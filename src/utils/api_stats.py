@@ -5,6 +5,7 @@ API統計管理モジュール
 """
 
 import logging
+import threading
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
@@ -23,6 +24,25 @@ class ApiStatEntry:
     console_url: str = ""  # クォータ確認用URL
 
 
+@dataclass(frozen=True, slots=True)
+class QuotaInfo:
+    """レスポンスヘッダーから得た日次クォータ（config.QUOTA_INFO の値）"""
+
+    remaining: int
+    limit: int | None = None  # ヘッダーに上限が無い場合はNone
+
+    @property
+    def used(self) -> int | None:
+        """消費済みリクエスト数（上限不明ならNone）"""
+        if self.limit is None:
+            return None
+        return self.limit - self.remaining
+
+    def __str__(self) -> str:
+        limit = self.limit if self.limit is not None else "Unknown"
+        return f"Remaining: {self.remaining} / Limit: {limit} (requests/day)"
+
+
 class ApiStats:
     """
     API呼び出し統計を一元管理するシングルトン
@@ -34,6 +54,8 @@ class ApiStats:
     """
 
     _stats: dict[str, ApiStatEntry] = {}
+    # 並列実行されるAPI呼び出しからのカウント更新を保護する
+    _lock = threading.Lock()
 
     # API定義（デフォルト設定）
     # unit_cost: 1回の呼び出しが消費するユニット数（YouTube search.list=100, playlistItems=1）
@@ -81,15 +103,17 @@ class ApiStats:
     @classmethod
     def record_call(cls, api_name: str, count: int = 1) -> None:
         """API呼び出しを記録"""
-        entry = cls._get_or_create(api_name)
-        entry.calls += count
+        with cls._lock:
+            entry = cls._get_or_create(api_name)
+            entry.calls += count
         logger.debug(f"[ApiStats] {api_name}: +{count} call(s), total={entry.calls}")
 
     @classmethod
     def record_cache_hit(cls, api_name: str, count: int = 1) -> None:
         """キャッシュヒットを記録"""
-        entry = cls._get_or_create(api_name)
-        entry.cache_hits += count
+        with cls._lock:
+            entry = cls._get_or_create(api_name)
+            entry.cache_hits += count
         logger.debug(
             f"[ApiStats] {api_name}: +{count} cache hit(s), total={entry.cache_hits}"
         )
@@ -7,6 +7,7 @@ Fixture単位でレポート処理状況を管理するCSVをGCSに保存・読
 import csv
 import io
 import logging
+import time
 from datetime import datetime
 
 from src.utils.datetime_util import DateTimeUtil
@@ -39,12 +40,17 @@ class FixtureStatusManager:
     # 最大再試行回数
     MAX_RETRY_ATTEMPTS = 3
 
+    # 参照系（get_status / is_processable）でCSVを再利用する期間（秒）
+    CSV_CACHE_TTL_SECONDS = 60
+
     def __init__(self, bucket_name: str = None):
         from settings.cache_config import GCS_BUCKET_NAME
 
         self.bucket_name = bucket_name or GCS_BUCKET_NAME
         self._bucket = None
         self._client = None
+        # CSV行のプロセス内キャッシュ（読み込み時刻, 行リスト）
+        self._rows_cache: tuple[float, list[dict[str, str]]] | None = None
 
     def _get_bucket(self):
         """GCSバケットを遅延初期化"""
@@ -60,8 +66,24 @@ class FixtureStatusManager:
                 raise
         return self._bucket
 
-    def _read_csv(self) -> list[dict[str, str]]:
-        """CSVを読み込んでリストとして返す"""
+    def _read_csv(self, use_cache: bool = False) -> list[dict[str, str]]:
+        """CSVを読み込んでリストとして返す
+
+        Args:
+            use_cache: Trueなら CSV_CACHE_TTL_SECONDS 以内の読み込み結果を再利用する
+                （更新系は他プロセスの書き込みを取りこぼさないよう常に再読み込み）
+        """
+        if use_cache and self._rows_cache is not None:
+            cached_at, cached_rows = self._rows_cache
+            if time.monotonic() - cached_at < self.CSV_CACHE_TTL_SECONDS:
+                return cached_rows
+
+        rows = self._download_csv()
+        self._rows_cache = (time.monotonic(), rows)
+        return rows
+
+    def _download_csv(self) -> list[dict[str, str]]:
+        """GCSからCSVをダウンロードしてリストとして返す"""
         try:
             bucket = self._get_bucket()
             blob = bucket.blob(self.CSV_PATH)
@@ -90,59 +112,79 @@ class FixtureStatusManager:
 
             blob.upload_from_string(output.getvalue(), content_type="text/csv")
             logger.info(f"CSV updated: {self.CSV_PATH}")
+            self._rows_cache = (time.monotonic(), rows)
             return True
         except Exception as e:
             logger.error(f"Failed to write CSV to GCS: {e}")
+            # 更新途中の行（未保存のステータス）を参照系に返さないよう破棄する
+            self._rows_cache = None
             return False
 
     def get_status(self, fixture_id: str) -> str | None:
         """指定fixtureIdのステータスを取得"""
-        rows = self._read_csv()
+        rows = self._read_csv(use_cache=True)
         for row in rows:
             if row.get("fixture_id") == str(fixture_id):
                 return row.get("status")
         return None
 
+    def get_records(self, fixture_ids: list[str]) -> dict[str, dict[str, str]]:
+        """複数fixtureIdのレコードを1回のCSV読み込みでまとめて取得
+
+        Returns:
+            fixture_id(str) -> CSV行 の辞書（レコードが無いIDは含まない）
+        """
+        wanted = {str(fixture_id) for fixture_id in fixture_ids}
+        return {
+            row["fixture_id"]: row
+            for row in self._read_csv(use_cache=True)
+            if row.get("fixture_id") in wanted
+        }
+
     def is_processable(self, fixture_id: str) -> bool:
         """処理対象かどうか判定（未処理 or 失敗で再試行可能）
 
         詳細なログを出力して判定理由を明確化
         """
-        rows = self._read_csv()
+        record = self.get_records([fixture_id]).get(str(fixture_id))
+        return self.is_record_processable(fixture_id, record)
 
-        for row in rows:
-            if row.get("fixture_id") == str(fixture_id):
-                status = row.get("status")
-                attempts = int(row.get("attempts", "0"))
-                last_attempt = row.get("last_attempt_at", "不明")
-
-                # 完了済みはスキップ
-                if status == self.STATUS_COMPLETE:
-                    logger.debug(
-                        f"[FixtureStatus {fixture_id}] スキップ: 処理完了済み (last_attempt: {last_attempt})"
-                    )
-                    return False
-
-                # 部分完了は再処理対象（次回実行時に再取得を試みる）
-                if status == self.STATUS_PARTIAL:
-                    logger.info(
-                        f"[FixtureStatus {fixture_id}] 再処理対象: 部分完了 (一部コンテンツ欠損, last_attempt: {last_attempt})"
-                    )
-                    return True
-
-                # 失敗で再試行上限に達している場合はスキップ
-                if status == self.STATUS_FAILED and attempts >= self.MAX_RETRY_ATTEMPTS:
-                    logger.warning(
-                        f"[FixtureStatus {fixture_id}] スキップ: 再試行上限到達 ({attempts}/{self.MAX_RETRY_ATTEMPTS})"
-                    )
-                    return False
-
-                # それ以外（pending, processing, failed with attempts < max）は処理可能
+    def is_record_processable(
+        self, fixture_id: str, record: dict[str, str] | None
+    ) -> bool:
+        """取得済みレコードから処理対象かどうか判定（recordがNoneなら未処理）"""
+        if record is not None:
+            status = record.get("status")
+            attempts = int(record.get("attempts", "0"))
+            last_attempt = record.get("last_attempt_at", "不明")
+
+            # 完了済みはスキップ
+            if status == self.STATUS_COMPLETE:
                 logger.debug(
-                    f"[FixtureStatus {fixture_id}] 処理可能: status={status}, attempts={attempts}/{self.MAX_RETRY_ATTEMPTS}"
+                    f"[FixtureStatus {fixture_id}] スキップ: 処理完了済み (last_attempt: {last_attempt})"
+                )
+                return False
+
+            # 部分完了は再処理対象（次回実行時に再取得を試みる）
+            if status == self.STATUS_PARTIAL:
+                logger.info(
+                    f"[FixtureStatus {fixture_id}] 再処理対象: 部分完了 (一部コンテンツ欠損, last_attempt: {last_attempt})"
                 )
                 return True
 
+            # 失敗で再試行上限に達している場合はスキップ
+            if status == self.STATUS_FAILED and attempts >= self.MAX_RETRY_ATTEMPTS:
+                logger.warning(
+                    f"[FixtureStatus {fixture_id}] スキップ: 再試行上限到達 ({attempts}/{self.MAX_RETRY_ATTEMPTS})"
+                )
+                return False
+
+            # それ以外（pending, processing, failed with attempts < max）は処理可能
+            logger.debug(
+                f"[FixtureStatus {fixture_id}] 処理可能: status={status}, attempts={attempts}/{self.MAX_RETRY_ATTEMPTS}"
+            )
+            return True
+
         # レコードが存在しない = 未処理 = 処理可能
         logger.debug(
             f"[FixtureStatus {fixture_id}] 処理可能: 初回処理（GCSレコードなし）"
@@ -151,62 +193,107 @@ class FixtureStatusManager:
 
     def mark_processing(self, fixture_id: str, kickoff_utc: datetime) -> bool:
         """処理開始をマーク"""
-        kickoff_jst = DateTimeUtil.to_jst(kickoff_utc)
-        date_str = kickoff_jst.strftime("%Y-%m-%d")
-        kickoff_str = kickoff_jst.isoformat()
-
-        return self._update_status(
-            fixture_id=str(fixture_id),
-            date=date_str,
-            kickoff_jst=kickoff_str,
-            status=self.STATUS_PROCESSING,
-            increment_attempts=False,
-        )
+        return self.mark_processing_batch([(fixture_id, kickoff_utc)])
+
+    def mark_processing_batch(self, fixtures: list[tuple[str, datetime]]) -> bool:
+        """複数試合の処理開始をまとめてマーク（CSVの読み書きは1回）
+
+        Args:
+            fixtures: (fixture_id, kickoff_utc) のリスト
+        """
+        updates = []
+        for fixture_id, kickoff_utc in fixtures:
+            kickoff_jst = DateTimeUtil.to_jst(kickoff_utc)
+            updates.append(
+                {
+                    "fixture_id": str(fixture_id),
+                    "date": kickoff_jst.strftime("%Y-%m-%d"),
+                    "kickoff_jst": kickoff_jst.isoformat(),
+                    "status": self.STATUS_PROCESSING,
+                }
+            )
+        return self._update_statuses(updates)
 
     def mark_complete(self, fixture_id: str) -> bool:
         """処理完了をマーク"""
-        return self._update_status(
-            fixture_id=str(fixture_id),
-            status=self.STATUS_COMPLETE,
-            increment_attempts=False,
+        return self.mark_complete_batch([fixture_id])
+
+    def mark_complete_batch(self, fixture_ids: list[str]) -> bool:
+        """複数試合の処理完了をまとめてマーク（CSVの読み書きは1回）"""
+        return self._update_statuses(
+            [
+                {"fixture_id": str(fixture_id), "status": self.STATUS_COMPLETE}
+                for fixture_id in fixture_ids
+            ]
         )
 
     def mark_failed(self, fixture_id: str, error: str) -> bool:
         """処理失敗をマーク（再試行カウント増加）"""
-        return self._update_status(
-            fixture_id=str(fixture_id),
-            status=self.STATUS_FAILED,
-            error_message=error,
-            increment_attempts=True,
+        return self.mark_failed_batch([fixture_id], error)
+
+    def mark_failed_batch(self, fixture_ids: list[str], error: str) -> bool:
+        """複数試合の処理失敗をまとめてマーク（再試行カウント増加）"""
+        return self._update_statuses(
+            [
+                {
+                    "fixture_id": str(fixture_id),
+                    "status": self.STATUS_FAILED,
+                    "error_message": error,
+                    "increment_attempts": True,
+                }
+                for fixture_id in fixture_ids
+            ]
         )
 
     def mark_partial(self, fixture_id: str, missing_content: str) -> bool:
         """部分完了をマーク（一部コンテンツ欠損、次回再処理対象）"""
-        return self._update_status(
-            fixture_id=str(fixture_id),
-            status=self.STATUS_PARTIAL,
-            error_message=f"Missing: {missing_content}",
-            increment_attempts=False,  # 部分完了はリトライカウントを増やさない
+        return self.mark_partial_batch([(fixture_id, missing_content)])
+
+    def mark_partial_batch(self, fixtures: list[tuple[str, str]]) -> bool:
+        """複数試合の部分完了をまとめてマーク
+
+        Args:
+            fixtures: (fixture_id, missing_content) のリスト
+        """
+        return self._update_statuses(
+            [
+                {
+                    "fixture_id": str(fixture_id),
+                    "status": self.STATUS_PARTIAL,
+                    "error_message": f"Missing: {missing_content}",
+                    # 部分完了はリトライカウントを増やさない
+                }
+                for fixture_id, missing_content in fixtures
+            ]
         )
 
-    def _update_status(
-        self,
-        fixture_id: str,
-        status: str,
-        date: str = None,
-        kickoff_jst: str = None,
-        error_message: str = None,
-        increment_attempts: bool = False,
-    ) -> bool:
-        """ステータスを更新または追加"""
+    def _update_statuses(self, updates: list[dict]) -> bool:
+        """複数のステータス更新を1回のCSV読み込み・書き込みで適用
+
+        Args:
+            updates: fixture_id, status と任意の date / kickoff_jst /
+                error_message / increment_attempts を持つ辞書のリスト
+        """
+        if not updates:
+            return True
+
         rows = self._read_csv()
         now_str = DateTimeUtil.now_jst().isoformat()
-
-        # 既存の行を更新
-        found = False
+        rows_by_id = {}
         for row in rows:
-            if row.get("fixture_id") == fixture_id:
-                row["status"] = status
+            rows_by_id.setdefault(row.get("fixture_id"), row)
+
+        for update in updates:
+            fixture_id = update["fixture_id"]
+            date = update.get("date")
+            kickoff_jst = update.get("kickoff_jst")
+            error_message = update.get("error_message")
+            increment_attempts = update.get("increment_attempts", False)
+
+            # 既存の行を更新
+            row = rows_by_id.get(fixture_id)
+            if row is not None:
+                row["status"] = update["status"]
                 row["last_attempt_at"] = now_str
 
                 if date:
@@ -219,24 +306,21 @@ class FixtureStatusManager:
                 if increment_attempts:
                     current_attempts = int(row.get("attempts", "0"))
                     row["attempts"] = str(current_attempts + 1)
-
-                found = True
-                break
-
-        # 新規追加
-        if not found:
-            rows.append(
-                {
-                    "fixture_id": fixture_id,
-                    "date": date or "",
-                    "kickoff_jst": kickoff_jst or "",
-                    "status": status,
-                    "first_attempt_at": now_str,
-                    "last_attempt_at": now_str,
-                    "attempts": "1" if increment_attempts else "0",
-                    "error_message": error_message or "",
-                }
-            )
+                continue
+
+            # 新規追加
+            row = {
+                "fixture_id": fixture_id,
+                "date": date or "",
+                "kickoff_jst": kickoff_jst or "",
+                "status": update["status"],
+                "first_attempt_at": now_str,
+                "last_attempt_at": now_str,
+                "attempts": "1" if increment_attempts else "0",
+                "error_message": error_message or "",
+            }
+            rows.append(row)
+            rows_by_id[fixture_id] = row
 
         # キックオフ時刻でソート（降順: 新しい試合が先頭）
         rows.sort(key=lambda x: x.get("kickoff_jst", ""), reverse=True)
@@ -12,6 +12,10 @@ from src.utils.datetime_util import DateTimeUtil
 
 logger = logging.getLogger(__name__)
 
+# ログの区切り線（呼び出しごとに文字列を組み立てない）
+_BANNER = "=" * 70
+_SEPARATOR = "-" * 70
+
 
 class MatchScheduler:
     """試合時刻に基づく実行判定"""
@@ -25,6 +29,9 @@ class MatchScheduler:
 
     def __init__(self):
         self.now = DateTimeUtil.now_jst()
+        # 「キックオフ1時間前〜24時間後に現在時刻が入る」をキックオフ時刻側の範囲に変換して一度だけ計算
+        self._kickoff_lower = self.now - timedelta(minutes=self.AFTER_KICKOFF_MINUTES)
+        self._kickoff_upper = self.now + timedelta(minutes=self.BEFORE_KICKOFF_MINUTES)
 
     def should_generate_report(self, matches: list) -> bool:
         """現在時刻で処理すべき試合があるか判定
@@ -80,25 +87,34 @@ class MatchScheduler:
         window_start = self.now - timedelta(minutes=self.BEFORE_KICKOFF_MINUTES)
         window_end = self.now + timedelta(minutes=self.AFTER_KICKOFF_MINUTES)
 
-        logger.info("=" * 70)
+        logger.info(_BANNER)
         logger.info("試合フィルタリング開始")
         logger.info(f"現在時刻 (JST): {self.now.strftime('%Y-%m-%d %H:%M:%S')}")
         logger.info(
             f"時間窓: {window_start.strftime('%m/%d %H:%M')} - {window_end.strftime('%m/%d %H:%M')}"
         )
         logger.info(f"全試合数: {len(matches)}")
-        logger.info("=" * 70)
+        logger.info(_BANNER)
+
+        # 試合ごとの判定ログは INFO 無効時には組み立てない
+        log_details = logger.isEnabledFor(logging.INFO)
 
         # 1. 時間ウィンドウでフィルタ
         time_filtered = []
         for match in matches:
-            kickoff_jst = DateTimeUtil.to_jst(match.core.kickoff_at_utc)
-            in_window = self._is_in_target_window(match)
+            kickoff_utc = match.core.kickoff_at_utc
+            if kickoff_utc is None:
+                logger.warning(f"kickoff_at_utc is None for match {match.id}")
+                continue
+            kickoff_jst = DateTimeUtil.to_jst(kickoff_utc)
+            in_window = self._is_kickoff_in_window(kickoff_jst)
 
-            log_msg = f"[Fixture {match.id}] {match.home_team} vs {match.away_team}"
-            log_msg += f" | キックオフ: {kickoff_jst.strftime('%m/%d %H:%M JST')}"
-            log_msg += f" | 時間窓: {'✅ 対象' if in_window else '❌ 対象外'}"
-            logger.info(log_msg)
+            if log_details:
+                logger.info(
+                    f"[Fixture {match.id}] {match.home_team} vs {match.away_team}"
+                    f" | キックオフ: {kickoff_jst.strftime('%m/%d %H:%M JST')}"
+                    f" | 時間窓: {'✅ 対象' if in_window else '❌ 対象外'}"
+                )
 
             if in_window:
                 time_filtered.append(match)
@@ -106,18 +122,23 @@ class MatchScheduler:
         logger.info(
             f"時間窓フィルタ結果: {len(time_filtered)}/{len(matches)} 試合が対象"
         )
-        logger.info("-" * 70)
+        logger.info(_SEPARATOR)
 
         # 2. GCSステータスでフィルタ（未処理 or 失敗で再試行可能）
+        # 対象試合のレコードは1回の読み込みでまとめて取得する
+        records = status_manager.get_records([match.id for match in time_filtered])
         processable = []
         for match in time_filtered:
-            is_processable = status_manager.is_processable(match.id)
-            gcs_status = status_manager.get_status(match.id) or "なし（初回処理）"
-
-            log_msg = f"[Fixture {match.id}] {match.home_team} vs {match.away_team}"
-            log_msg += f" | GCSステータス: {gcs_status}"
-            log_msg += f" | 処理可能: {'✅ Yes' if is_processable else '❌ No'}"
-            logger.info(log_msg)
+            record = records.get(str(match.id))
+            is_processable = status_manager.is_record_processable(match.id, record)
+            gcs_status = (record or {}).get("status") or "なし（初回処理）"
+
+            if log_details:
+                logger.info(
+                    f"[Fixture {match.id}] {match.home_team} vs {match.away_team}"
+                    f" | GCSステータス: {gcs_status}"
+                    f" | 処理可能: {'✅ Yes' if is_processable else '❌ No'}"
+                )
 
             if is_processable:
                 processable.append(match)
@@ -125,7 +146,7 @@ class MatchScheduler:
         logger.info(
             f"ステータスフィルタ結果: {len(processable)}/{len(time_filtered)} 試合が処理可能"
         )
-        logger.info("=" * 70)
+        logger.info(_BANNER)
 
         # 選定（ランク順ソート・件数制限）はワークフロー側で MatchSelector が行う
         return processable
@@ -139,17 +160,10 @@ class MatchScheduler:
                 logger.warning(f"kickoff_at_utc is None for match {match.id}")
                 return False
 
-            kickoff_jst = DateTimeUtil.to_jst(kickoff_utc)
-
-            window_start = kickoff_jst - timedelta(minutes=self.BEFORE_KICKOFF_MINUTES)
-            window_end = kickoff_jst + timedelta(minutes=self.AFTER_KICKOFF_MINUTES)
-
-            is_in_window = window_start <= self.now <= window_end
+            is_in_window = self._is_kickoff_in_window(DateTimeUtil.to_jst(kickoff_utc))
 
             if is_in_window:
-                logger.debug(
-                    f"Match {match.id} is in target window: {window_start} - {window_end}"
-                )
+                logger.debug(f"Match {match.id} is in target window")
 
             return is_in_window
 
@@ -157,6 +171,10 @@ class MatchScheduler:
             logger.warning(f"Failed to check target window for match: {e}")
             return False
 
+    def _is_kickoff_in_window(self, kickoff_jst) -> bool:
+        """キックオフ時刻が事前計算済みの対象範囲内かどうか"""
+        return self._kickoff_lower <= kickoff_jst <= self._kickoff_upper
+
     def _get_rank_priority(self, match) -> int:
         """ランクを優先度に変換（S=0, A=1, B=2, ...）"""
         rank_order = {"S": 0, "A": 1, "B": 2, "C": 3, "D": 4}
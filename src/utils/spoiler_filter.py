@@ -49,6 +49,7 @@ class SpoilerFilter:
             "先制",
             "決勝点",
         ]
+        self._banned_lower = [k.lower() for k in self.banned_keywords]
 
     def check_text(self, text: str) -> str:
         # Issue #32: CENSORED置換を無効化し、そのまま出力
@@ -57,13 +58,14 @@ class SpoilerFilter:
 
     def is_safe_article(self, article_content: str) -> bool:
         # Pre-check: if too many forbidden words, mark as unsafe
+        # If it looks like a match report (many hits), reject it as soon as
+        # the threshold is crossed instead of scanning every keyword
+        text_l = article_content.lower()
         hits = 0
-        for keyword in self.banned_keywords:
-            if keyword.lower() in article_content.lower():
+        for keyword in self._banned_lower:
+            if keyword in text_l:
                 hits += 1
-
-        # If it looks like a match report (many hits), reject it
-        if hits > 3:
-            return False
+                if hits > 3:
+                    return False
 
         return True
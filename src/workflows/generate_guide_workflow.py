@@ -1,21 +1,80 @@
+import concurrent.futures
+import functools
 import logging
 import os
+import time
 
 from config import config
-from src.cache_warmer import run_cache_warming
+from src.cache_warmer import get_cache_warming_skip_reason, run_cache_warming
+from src.clients.api_football_client import ApiFootballClient
+from src.clients.http_client import get_http_client
+from src.clients.llm_client import (
+    get_rate_limit_failures_for,
+    reset_rate_limit_failures,
+)
 from src.domain.match_selector import MatchSelector
 from src.facts_service import FactsService
+from src.html_generator import generate_html_reports, prefetch_remote_manifest
 from src.match_processor import MatchProcessor
 from src.news_service import NewsService
+from src.prediction_service import PredictionService
 from src.report_generator import ReportGenerator
 from src.utils.datetime_util import DateTimeUtil
+from src.utils.fixture_status_manager import FixtureStatusManager
 from src.utils.match_scheduler import MatchScheduler
+from src.youtube_service import YouTubeService
+
+# メール送信は任意機能のため、モジュール読み込み時に一度だけ可用性を判定する
+try:
+    from src.email_service import send_debug_summary
+except ImportError:
+    send_debug_summary = None
 
 logger = logging.getLogger(__name__)
 
 # Firebase Hosting URL
 FIREBASE_BASE_URL = "https://football-delay-watching-a8830.web.app"
 
+# API-Football クォータ確認エンドポイントと結果の再利用期間（秒）
+API_FOOTBALL_STATUS_URL = "https://v3.football.api-sports.io/status"
+QUOTA_PROBE_TTL_SECONDS = 60
+
+# ログの区切り線（呼び出しごとに文字列を組み立てない）
+_BANNER = "=" * 70
+_SUMMARY_BANNER = "=" * 50
+
+# クリティカルパス外の後処理（キャッシュウォーミング・manifest先行取得）用
+BACKGROUND_MAX_WORKERS = 4
+
+
+@functools.lru_cache(maxsize=1)
+def _fetch_remaining_quota(ttl_token: int) -> int:
+    """
+    API-Football の残りクォータを /status で確認する
+
+    共有HTTPクライアント（接続プール付きSession）を再利用し、
+    同じ ttl_token の間は結果をプロセス内でメモ化する。
+    """
+    try:
+        response = get_http_client().get(
+            API_FOOTBALL_STATUS_URL,
+            headers={"x-apisports-key": config.API_FOOTBALL_KEY},
+            timeout=10,
+        )
+        if response.status_code == 200:
+            data = response.json()
+            requests_info = data.get("response", {}).get("requests", {})
+            limit = requests_info.get("limit_day", 100)
+            current = requests_info.get("current", 0)
+            remaining_quota = limit - current
+            logger.info(
+                f"API-Football quota check: {remaining_quota}/{limit} remaining"
+            )
+            return remaining_quota
+    except Exception as e:
+        logger.warning(f"Failed to check API quota: {e}")
+    return 0
+
 
 class GenerateGuideWorkflow:
     """
@@ -28,31 +87,51 @@ class GenerateGuideWorkflow:
         self._log_execution_info(dry_run)
 
         # Step 1: 試合選定
-        matches, status_manager = self._step_select_matches()
+        matches, target_matches, status_manager = self._step_select_matches()
         if not matches:
             self._log_skip_summary()
             return
 
+        # レポート/HTML公開後の後処理はバックグラウンドで並列実行し、最後にまとめて待つ
+        self._background_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=BACKGROUND_MAX_WORKERS
+        )
+        self._background_futures = []
+
+        # HTML生成時にしか使わないリモートmanifestを先行取得しておく
+        self._remote_manifest_future = prefetch_remote_manifest(
+            self._background_executor
+        )
+
         try:
             # Step 2: データエンリッチメント
             youtube_videos, youtube_stats = self._step_enrich_data(matches)
 
             # Step 3: レポート生成・配信
-            self._step_generate_reports(matches, youtube_videos, youtube_stats)
+            report_list = self._step_generate_reports(
+                matches, target_matches, youtube_videos, youtube_stats
+            )
 
             # Step 4: 完了処理
-            self._step_finalize(matches, status_manager, youtube_videos)
+            self._step_finalize(matches, target_matches, status_manager, youtube_videos)
 
         except Exception as e:
-            self._handle_error(e, matches, status_manager)
+            self._handle_error(e, target_matches, status_manager)
             raise
 
+        finally:
+            self._wait_background_tasks()
+
+        # 14. Email Notification (シンプルなデバッグサマリ)
+        # API消費状況にキャッシュウォーミング等の呼び出しも含めるため、全処理の完了後に送信する
+        self._send_debug_email(target_matches, report_list, youtube_stats)
+
         logger.info("Workflow completed.")
 
     def _log_execution_info(self, dry_run: bool):
         """実行情報のログ出力"""
         now_jst = DateTimeUtil.now_jst()
-        logger.info("=" * 70)
+        logger.info(_BANNER)
         logger.info("GitHub Actions / ワークフロー実行開始")
         logger.info(f"実行時刻 (JST): {now_jst.strftime('%Y-%m-%d %H:%M:%S')}")
         logger.info(f"TARGET_DATE: {config.TARGET_DATE.strftime('%Y-%m-%d %H:%M JST')}")
@@ -63,7 +142,7 @@ class GenerateGuideWorkflow:
             f"モード: {'モック' if config.USE_MOCK_DATA else 'デバッグ' if config.DEBUG_MODE else '本番'}"
         )
         logger.info(f"Dry Run: {dry_run}")
-        logger.info("=" * 70)
+        logger.info(_BANNER)
         logger.info(
             f"Starting workflow... (Dry Run: {dry_run}, Mock: {config.USE_MOCK_DATA})"
         )
@@ -73,19 +152,19 @@ class GenerateGuideWorkflow:
         ステップ1: 試合選定
 
         Returns:
-            (matches, status_manager): 選定された試合リストとステータスマネージャー
+            (matches, target_matches, status_manager):
+                選定された試合リスト、そのうち is_target=True の試合リスト、
+                ステータスマネージャー
         """
         processor = MatchProcessor()
         all_matches = processor.run()
 
         if not all_matches:
-            return [], None
+            return [], [], None
 
         # 2. 時間ベースフィルタリング + ステータス管理（本番モードのみ）
         status_manager = None
         if not config.USE_MOCK_DATA and not config.DEBUG_MODE:
-            from src.utils.fixture_status_manager import FixtureStatusManager
-
             status_manager = FixtureStatusManager()
             scheduler = MatchScheduler()
             selector = MatchSelector()
@@ -99,27 +178,30 @@ class GenerateGuideWorkflow:
                 logger.info(
                     "現在処理対象の試合なし（時間外 or 処理済み）。次回実行まで待機。"
                 )
-                return [], None
+                return [], [], None
 
             # 3. 最終選定（ランク順ソート + MATCH_LIMIT適用）
             matches = selector.select(processable_matches)
+            target_matches = [m for m in matches if m.is_target]
             logger.info(
-                f"最終選定: {len([m for m in matches if m.is_target])} 試合（処理可能: {len(processable_matches)} 試合から）"
+                f"最終選定: {len(target_matches)} 試合（処理可能: {len(processable_matches)} 試合から）"
             )
 
-            # 処理開始マーク（is_target=Trueの試合のみ）
-            for match in matches:
-                if match.is_target:
-                    status_manager.mark_processing(match.id, match.core.kickoff_at_utc)
-                    logger.info(
-                        f"試合 {match.id} ({match.home_team} vs {match.away_team}) を処理開始としてマーク"
-                    )
+            # 処理開始マーク（is_target=Trueの試合のみ、GCS書き込みは1回）
+            status_manager.mark_processing_batch(
+                [(m.id, m.core.kickoff_at_utc) for m in target_matches]
+            )
+            for match in target_matches:
+                logger.info(
+                    f"試合 {match.id} ({match.home_team} vs {match.away_team}) を処理開始としてマーク"
+                )
 
-            return matches, status_manager
+            return matches, target_matches, status_manager
         else:
             # モック・デバッグモードでも選定ロジックを適用
             selector = MatchSelector()
-            return selector.select(all_matches), None
+            matches = selector.select(all_matches)
+            return matches, [m for m in matches if m.is_target], None
 
     def _step_enrich_data(self, matches):
         """
@@ -128,33 +210,45 @@ class GenerateGuideWorkflow:
         Returns:
             (youtube_videos, youtube_stats)
         """
-        from src.clients.llm_client import reset_rate_limit_failures
-
         reset_rate_limit_failures()
 
         # 3. Facts Acquisition
+        # ニュース・YouTube はスタメン/監督情報を参照するため先に完了させる
         facts_service = FactsService()
         facts_service.enrich_matches(matches)
 
-        # 3.5 Prediction Data (Issue #199)
-        try:
-            from src.prediction_service import PredictionService
+        # 3.5 / 4 / 5: 予測・ニュース・YouTube は互いに独立したI/O処理のため並列実行
+        # （全て submit してから result() を待つ）
+        news_service = NewsService()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+            prediction_future = executor.submit(self._run_prediction, matches)
+            news_future = executor.submit(news_service.process_news, matches)
+            youtube_future = executor.submit(self._run_youtube, matches)
+
+            prediction_future.result()
+            news_future.result()
+            youtube_videos, youtube_stats = youtube_future.result()
+
+        return youtube_videos, youtube_stats
 
+    def _run_prediction(self, matches):
+        """3.5 Prediction Data (Issue #199)"""
+        try:
             prediction_service = PredictionService()
             prediction_service.enrich_matches(matches)
         except Exception as e:
             logger.warning(f"Prediction enrichment failed (continuing): {e}")
 
-        # 4. News Collection & Summarization
-        news_service = NewsService()
-        news_service.process_news(matches)
+    def _run_youtube(self, matches):
+        """
+        5. YouTube Videos
 
-        # 5. YouTube Videos
+        Returns:
+            (youtube_videos, youtube_stats)
+        """
         youtube_videos = {}
         youtube_stats = {"api_calls": 0, "cache_hits": 0}
         try:
-            from src.youtube_service import YouTubeService
-
             youtube_service = YouTubeService()
             youtube_videos = youtube_service.process_matches(matches)
             youtube_stats = {
@@ -169,7 +263,9 @@ class GenerateGuideWorkflow:
 
         return youtube_videos, youtube_stats
 
-    def _step_generate_reports(self, matches, youtube_videos, youtube_stats):
+    def _step_generate_reports(
+        self, matches, target_matches, youtube_videos, youtube_stats
+    ):
         """
         ステップ3: レポート生成・配信
 
@@ -187,69 +283,71 @@ class GenerateGuideWorkflow:
         # 7. HTML Generation
         self._generate_html(report_list)
 
-        # 8. Email Notification (シンプルなデバッグサマリ)
-        self._send_debug_email(matches, report_list, youtube_stats)
-
         return report_list
 
-    def _step_finalize(self, matches, status_manager, youtube_videos):
+    def _step_finalize(self, matches, target_matches, status_manager, youtube_videos):
         """
         ステップ4: 完了処理
         """
         # 9. 品質チェックに基づくGCSステータス更新
+        # 失敗時に _handle_error で失敗マークできるよう同期実行する
         if status_manager:
-            for match in matches:
-                if match.is_target:
-                    is_complete, missing = self._check_report_quality(
-                        match, youtube_videos
-                    )
-                    if is_complete:
-                        status_manager.mark_complete(match.id)
-                        logger.info(
-                            f"試合 {match.id} ({match.home_team} vs {match.away_team}) を処理完了としてマーク"
-                        )
-                    else:
-                        # partial の場合、スタメン欠損ならキャッシュをクリアして次回実行時に再取得を促す
-                        if "home_lineup" in missing or "away_lineup" in missing:
-                            from src.clients.api_football_client import (
-                                ApiFootballClient,
-                            )
-
-                            api_client = ApiFootballClient()
-                            api_client.delete_lineup_cache(match.id)
-                            logger.info(
-                                f"試合 {match.id} のスタメンキャッシュをクリアしました（欠損があるため）"
-                            )
-
-                        status_manager.mark_partial(match.id, ", ".join(missing))
-                        logger.warning(
-                            f"試合 {match.id} ({match.home_team} vs {match.away_team}) を部分完了としてマーク (欠損: {missing})"
-                        )
-                else:
-                    logger.info(
-                        f"試合 {match.id} ({match.home_team} vs {match.away_team}) はis_target=Falseのためスキップ（GCS更新なし）"
-                    )
+            self._update_fixture_statuses(matches, status_manager, youtube_videos)
 
         # 11. Write Quota Info
+        # キャッシュウォーミングのAPI呼び出し前の値を書き出すため、ウォーミング投入より先に行う
         self._write_quota_info()
 
         # 12. Cache Warming
-        self._run_cache_warming()
+        self._submit_background(self._run_cache_warming)
 
         # 13. 処理完了ログ
-        match_count = len([m for m in matches if m.is_target])
-        logger.info(f"処理完了: {match_count}試合のレポートを生成")
+        logger.info(f"処理完了: {len(target_matches)}試合のレポートを生成")
+
+    def _update_fixture_statuses(self, matches, status_manager, youtube_videos):
+        """品質チェック結果に基づき各試合のGCSステータスを更新（種別ごとに一括書き込み）"""
+        complete_ids = []
+        partial_fixtures = []
+        for match in matches:
+            if match.is_target:
+                is_complete, missing = self._check_report_quality(match, youtube_videos)
+                if is_complete:
+                    complete_ids.append(match.id)
+                    logger.info(
+                        f"試合 {match.id} ({match.home_team} vs {match.away_team}) を処理完了としてマーク"
+                    )
+                else:
+                    # partial の場合、スタメン欠損ならキャッシュをクリアして次回実行時に再取得を促す
+                    if "home_lineup" in missing or "away_lineup" in missing:
+                        api_client = ApiFootballClient()
+                        api_client.delete_lineup_cache(match.id)
+                        logger.info(
+                            f"試合 {match.id} のスタメンキャッシュをクリアしました（欠損があるため）"
+                        )
+
+                    partial_fixtures.append((match.id, ", ".join(missing)))
+                    logger.warning(
+                        f"試合 {match.id} ({match.home_team} vs {match.away_team}) を部分完了としてマーク (欠損: {missing})"
+                    )
+            else:
+                logger.info(
+                    f"試合 {match.id} ({match.home_team} vs {match.away_team}) はis_target=Falseのためスキップ（GCS更新なし）"
+                )
+
+        if complete_ids:
+            status_manager.mark_complete_batch(complete_ids)
+        if partial_fixtures:
+            status_manager.mark_partial_batch(partial_fixtures)
 
-    def _handle_error(self, e, matches, status_manager):
+    def _handle_error(self, e, target_matches, status_manager):
         """エラーハンドリング（ステータス更新含む）"""
         logger.error(f"レポート生成に失敗: {e}", exc_info=True)
 
         # 10. 失敗時: GCSステータス更新
         if status_manager:
-            for match in matches:
-                if match.is_target:
-                    status_manager.mark_failed(match.id, str(e))
-                    logger.warning(f"試合 {match.id} を失敗としてマーク（再試行可能）")
+            status_manager.mark_failed_batch([m.id for m in target_matches], str(e))
+            for match in target_matches:
+                logger.warning(f"試合 {match.id} を失敗としてマーク（再試行可能）")
 
         # 11. Write Quota Info
         self._write_quota_info()
@@ -258,11 +356,24 @@ class GenerateGuideWorkflow:
         self._run_cache_warming()
 
         # 13. 処理完了ログ
-        match_count = len([m for m in matches if m.is_target])
-        logger.info(f"処理完了: {match_count}試合のレポートを生成")
+        logger.info(f"処理完了: {len(target_matches)}試合のレポートを生成")
 
         logger.info("Workflow completed.")
 
+    def _submit_background(self, fn, *args):
+        """クリティカルパス外の後処理をバックグラウンドに投入"""
+        self._background_futures.append(self._background_executor.submit(fn, *args))
+
+    def _wait_background_tasks(self):
+        """バックグラウンドの後処理の完了を待つ（失敗はログのみ）"""
+        for future in self._background_futures:
+            try:
+                future.result()
+            except Exception as e:
+                logger.warning(f"Background task failed: {e}", exc_info=True)
+        self._background_executor.shutdown(wait=True)
+        self._background_futures = []
+
     def _check_report_quality(self, match, youtube_videos: dict) -> tuple:
         """
         レポートの品質をチェック
@@ -270,8 +381,6 @@ class GenerateGuideWorkflow:
         Returns:
             (is_complete, missing_items): 完全か否かと、欠損コンテンツのリスト
         """
-        from src.clients.llm_client import get_rate_limit_failures_for
-
         missing = []
 
         # 必須: スタメン（ホーム・アウェイ両方）
@@ -300,111 +409,88 @@ class GenerateGuideWorkflow:
     def _generate_html(self, report_list):
         html_paths = []
         try:
-            from src.html_generator import generate_html_reports
-
-            html_paths = generate_html_reports(report_list)
+            html_paths = generate_html_reports(
+                report_list,
+                remote_manifest_future=self._remote_manifest_future,
+            )
             logger.info(f"Generated {len(html_paths)} HTML files")
         except Exception as e:
             logger.warning(f"HTML generation failed (continuing): {e}")
         return html_paths
 
-    def _send_debug_email(self, matches, report_list, youtube_stats):
+    def _send_debug_email(self, target_matches, report_list, youtube_stats):
         """シンプルなデバッグサマリをメール送信"""
-        if config.GMAIL_ENABLED and config.NOTIFY_EMAIL:
-            try:
-                from src.email_service import send_debug_summary
-
-                # レポートURLを構築
-                report_urls = []
-                for r in report_list:
-                    filename = r.get("filename", "")
-                    if filename:
-                        url = f"{FIREBASE_BASE_URL}/reports/{filename}.html"
-                        report_urls.append(url)
-
-                # 試合サマリを構築
-                matches_summary = []
-                target_matches = [m for m in matches if m.is_target]
-                for match in target_matches:
-                    matches_summary.append(
-                        {
-                            "home": match.home_team,
-                            "away": match.away_team,
-                            "competition": match.competition,
-                            "kickoff": match.kickoff_jst,
-                            "rank": match.rank,
-                        }
-                    )
+        if not (config.GMAIL_ENABLED and config.NOTIFY_EMAIL):
+            return
+        if send_debug_summary is None:
+            logger.warning("Email service not available.")
+            return
 
-                # モード判定
-                is_mock = config.USE_MOCK_DATA
-                is_debug = config.DEBUG_MODE
-
-                logger.info(f"Sending debug summary email to {config.NOTIFY_EMAIL}...")
-                if send_debug_summary(
-                    report_urls=report_urls,
-                    matches_summary=matches_summary,
-                    quota_info=config.QUOTA_INFO or {},
-                    youtube_stats=youtube_stats,
-                    is_mock=is_mock,
-                    is_debug=is_debug,
-                ):
-                    logger.info("Email sent successfully!")
-                else:
-                    logger.warning("Failed to send email notification.")
-            except ImportError:
-                logger.warning("Email service not available.")
+        # レポートURLを構築（公開先のパスはファイル名だけで決まる）
+        report_urls = [
+            f"{FIREBASE_BASE_URL}/reports/{r['filename']}.html"
+            for r in report_list
+            if r.get("filename")
+        ]
+
+        # 試合サマリを構築
+        matches_summary = []
+        for match in target_matches:
+            matches_summary.append(
+                {
+                    "home": match.home_team,
+                    "away": match.away_team,
+                    "competition": match.competition,
+                    "kickoff": match.kickoff_jst,
+                    "rank": match.rank,
+                }
+            )
+
+        # モード判定
+        is_mock = config.USE_MOCK_DATA
+        is_debug = config.DEBUG_MODE
+
+        logger.info(f"Sending debug summary email to {config.NOTIFY_EMAIL}...")
+        if send_debug_summary(
+            report_urls=report_urls,
+            matches_summary=matches_summary,
+            quota_info=config.QUOTA_INFO or {},
+            youtube_stats=youtube_stats,
+            is_mock=is_mock,
+            is_debug=is_debug,
+        ):
+            logger.info("Email sent successfully!")
+        else:
+            logger.warning("Failed to send email notification.")
 
     def _write_quota_info(self):
         if config.QUOTA_INFO:
             quota_file = "/tmp/quota.txt"
+            payload = "".join(
+                f"{key}: {info}\n" for key, info in config.QUOTA_INFO.items()
+            )
             try:
                 with open(quota_file, "w", encoding="utf-8") as f:
-                    for key, info in config.QUOTA_INFO.items():
-                        f.write(f"{key}: {info}\n")
+                    f.write(payload)
                 logger.info(f"Quota info written to {quota_file}")
             except Exception as e:
                 logger.warning(f"Failed to write quota info: {e}")
 
     def _run_cache_warming(self):
         # 7. Cache Warming (if quota available and GCS enabled)
-        remaining_quota = 0
-
-        # Get remaining quota from QUOTA_INFO or by checking API
-        if "API-Football" in config.QUOTA_INFO:
-            quota_str = config.QUOTA_INFO.get("API-Football", "")
-            if "Remaining:" in quota_str:
-                try:
-                    remaining_quota = int(
-                        quota_str.split("Remaining:")[1].split("/")[0].strip()
-                    )
-                except (ValueError, IndexError):
-                    pass
+        # 無効化・モック・デバッグ時はクォータ確認のHTTP呼び出しも行わない
+        if get_cache_warming_skip_reason():
+            return
 
-        # If no quota info (e.g. all cache hits in workflow), check directly via API if not mock
-        if remaining_quota == 0 and not config.USE_MOCK_DATA:
-            import requests  # Or use ApiFootballClient?
+        # Get remaining quota from QUOTA_INFO (QuotaInfo) or by checking API
+        api_football_quota = (config.QUOTA_INFO or {}).get("API-Football")
+        remaining_quota = api_football_quota.remaining if api_football_quota else 0
 
-            # To avoid cyclic dependency or overcomplication, reuse simple request or use client.
-            # Ideally use ApiFootballClient but we need to instantiate it or pass it.
-            # MatchProcessor has one.
-            # Let's try to check simply.
-            try:
-                # Basic check
-                url = "https://v3.football.api-sports.io/status"
-                headers = {"x-apisports-key": config.API_FOOTBALL_KEY}
-                response = requests.get(url, headers=headers, timeout=10)
-                if response.status_code == 200:
-                    data = response.json()
-                    requests_info = data.get("response", {}).get("requests", {})
-                    limit = requests_info.get("limit_day", 100)
-                    current = requests_info.get("current", 0)
-                    remaining_quota = limit - current
-                    logger.info(
-                        f"API-Football quota check: {remaining_quota}/{limit} remaining"
-                    )
-            except Exception as e:
-                logger.warning(f"Failed to check API quota: {e}")
+        # If no quota info (e.g. all cache hits in workflow), check directly via API
+        if remaining_quota == 0:
+            remaining_quota = _fetch_remaining_quota(
+                int(time.time() // QUOTA_PROBE_TTL_SECONDS)
+            )
 
         if remaining_quota > 0:
             logger.info(
@@ -423,11 +509,11 @@ class GenerateGuideWorkflow:
         target_date = config.TARGET_DATE
         date_str = DateTimeUtil.format_date_str(target_date)
 
-        logger.info("=" * 50)
+        logger.info(_SUMMARY_BANNER)
         logger.info("スキップサマリ")
         logger.info(f"  対象日: {date_str}")
         logger.info(
             f"  モード: {'モック' if config.USE_MOCK_DATA else 'デバッグ' if config.DEBUG_MODE else '本番'}"
         )
         logger.info("  結果: 対象試合なし")
-        logger.info("=" * 50)
+        logger.info(_SUMMARY_BANNER)
@@ -5,114 +5,114 @@ YouTubeServiceから分離されたフィルタリングロジック。
 各検索カテゴリで適用するフィルターを選択的に組み合わせる設計。
 """
 
+import json
 import logging
+import re
+from functools import lru_cache
+from itertools import islice
 
-from settings.channels import get_channel_info, is_trusted_channel
+from settings.channels import get_trusted_channel_info
 
 logger = logging.getLogger(__name__)
 
 
+# フィルタ名 -> 除外判定パターン（"タイトル 説明" に対して大文字小文字を無視して検索）
+_FILTER_PATTERNS: dict[str, re.Pattern] = {
+    # highlights + vs/v パターン（順不同）
+    "match_highlights": re.compile(
+        r"^(?=.*highlights)(?=.* (?:vs[ .]|v ))", re.IGNORECASE | re.DOTALL
+    ),
+    # highlights, match highlights, extended highlights
+    "highlights": re.compile(r"highlights", re.IGNORECASE),
+    "full_match": re.compile(r"full (?:match|game|replay)", re.IGNORECASE),
+    # live, livestream, watch live, streaming
+    # "live" は前後が英字でないときのみ判定（Liverpool, delivery, alive などを誤除外しない）
+    # \b は日本語も単語文字とみなすため使わない（"LIVE配信" を取りこぼす）
+    "live_stream": re.compile(
+        r"(?<![a-z])live(?:stream[a-z]*)?(?![a-z])|streaming", re.IGNORECASE
+    ),
+    "press_conference": re.compile(r"press conference", re.IGNORECASE),
+    "reaction": re.compile(r"reaction", re.IGNORECASE),
+}
+
+
+@lru_cache(maxsize=32)
+def _combined_filter_pattern(filters: tuple[str, ...]) -> re.Pattern | None:
+    """
+    指定フィルタのいずれかにマッチするかを1回の走査で判定するパターン
+
+    大半の動画はどのフィルタにもマッチしないため、まずこのパターンで一括判定し、
+    マッチした動画だけ個別パターンで除外理由を特定する。
+    """
+    sources = [
+        f"(?:{_FILTER_PATTERNS[name].pattern})"
+        for name in filters
+        if name in _FILTER_PATTERNS
+    ]
+    if not sources:
+        return None
+    return re.compile("|".join(sources), re.IGNORECASE | re.DOTALL)
+
+
+def _filter_text(video: dict) -> str:
+    """フィルタ判定対象のテキスト（タイトル + 説明）"""
+    return f"{video.get('title', '')} {video.get('description', '')}"
+
+
+# LLMレスポンスを囲むマークダウンコードブロック（先頭の ```json 行と末尾の ```）
+_CODE_FENCE_RE = re.compile(r"\A\s*```[^\n]*\n?|\n?[ \t]*```\s*\Z")
+
+
+def _strip_code_fence(response_text: str) -> str:
+    """LLMレスポンスのマークダウンコードブロックを除去"""
+    return _CODE_FENCE_RE.sub("", response_text).strip()
+
+
 class YouTubePostFilter:
     """YouTube動画のpost-filterを提供するクラス"""
 
+    # LLMフィルタに1回で渡す動画の最大件数（トークン節約）
+    MAX_VIDEOS_FOR_LLM = 20
+    # この件数以下ならLLMフィルタを呼ばずに全件残す（絞り込む効果が小さいため）
+    MIN_VIDEOS_FOR_LLM = 3
+
     # ========== 個別フィルタメソッド ==========
 
     def filter_match_highlights(self, videos: list[dict]) -> dict[str, list[dict]]:
         """
         試合ハイライトを除外（highlights + vs/v パターン）
         """
-        kept, removed = [], []
-        for v in videos:
-            text = f"{v.get('title', '')} {v.get('description', '')}".lower()
-            if "highlights" in text and (
-                " vs " in text or " v " in text or " vs." in text
-            ):
-                vv = dict(v)
-                vv["filter_reason"] = "match_highlights"
-                removed.append(vv)
-            else:
-                kept.append(v)
-        return {"kept": kept, "removed": removed}
+        return self._partition(videos, ["match_highlights"])
 
     def filter_highlights(self, videos: list[dict]) -> dict[str, list[dict]]:
         """
         単独ハイライトを除外（highlights, match highlights, extended highlights）
         """
-        keywords = ["highlights", "match highlights", "extended highlights"]
-        kept, removed = [], []
-        for v in videos:
-            text = f"{v.get('title', '')} {v.get('description', '')}".lower()
-            if any(kw in text for kw in keywords):
-                vv = dict(v)
-                vv["filter_reason"] = "highlights"
-                removed.append(vv)
-            else:
-                kept.append(v)
-        return {"kept": kept, "removed": removed}
+        return self._partition(videos, ["highlights"])
 
     def filter_full_match(self, videos: list[dict]) -> dict[str, list[dict]]:
         """
         フルマッチを除外（full match, full game, full replay）
         """
-        keywords = ["full match", "full game", "full replay"]
-        kept, removed = [], []
-        for v in videos:
-            text = f"{v.get('title', '')} {v.get('description', '')}".lower()
-            if any(kw in text for kw in keywords):
-                vv = dict(v)
-                vv["filter_reason"] = "full_match"
-                removed.append(vv)
-            else:
-                kept.append(v)
-        return {"kept": kept, "removed": removed}
+        return self._partition(videos, ["full_match"])
 
     def filter_live_stream(self, videos: list[dict]) -> dict[str, list[dict]]:
         """
         ライブ配信を除外（live, livestream, watch live, streaming）
         """
-        keywords = ["live", "livestream", "watch live", "streaming"]
-        kept, removed = [], []
-        for v in videos:
-            text = f"{v.get('title', '')} {v.get('description', '')}".lower()
-            if any(kw in text for kw in keywords):
-                vv = dict(v)
-                vv["filter_reason"] = "live_stream"
-                removed.append(vv)
-            else:
-                kept.append(v)
-        return {"kept": kept, "removed": removed}
+        return self._partition(videos, ["live_stream"])
 
     def filter_press_conference(self, videos: list[dict]) -> dict[str, list[dict]]:
         """
         記者会見を除外（press conference）
         """
-        keywords = ["press conference"]
-        kept, removed = [], []
-        for v in videos:
-            text = f"{v.get('title', '')} {v.get('description', '')}".lower()
-            if any(kw in text for kw in keywords):
-                vv = dict(v)
-                vv["filter_reason"] = "press_conference"
-                removed.append(vv)
-            else:
-                kept.append(v)
-        return {"kept": kept, "removed": removed}
+        return self._partition(videos, ["press_conference"])
 
     def filter_reaction(self, videos: list[dict]) -> dict[str, list[dict]]:
         """
         リアクション動画を除外（reaction）
         """
-        keywords = ["reaction"]
-        kept, removed = [], []
-        for v in videos:
-            text = f"{v.get('title', '')} {v.get('description', '')}".lower()
-            if any(kw in text for kw in keywords):
-                vv = dict(v)
-                vv["filter_reason"] = "reaction"
-                removed.append(vv)
-            else:
-                kept.append(v)
-        return {"kept": kept, "removed": removed}
+        return self._partition(videos, ["reaction"])
 
     # ========== 組み合わせAPI ==========
 
@@ -122,6 +122,10 @@ class YouTubePostFilter:
         """
         複数フィルタをまとめて適用
 
+        動画ごとにテキストを1回だけ組み立て、指定順で最初にマッチしたフィルタを
+        除外理由とする（フィルタを順に適用した場合と同じ結果）。
+        除外された動画は入力の辞書そのものに filter_reason を付与して返す。
+
         Args:
             videos: 動画リスト
             filters: 適用するフィルタ名のリスト
@@ -130,28 +134,61 @@ class YouTubePostFilter:
         Returns:
             {"kept": [...], "removed": [...]}
         """
-        filter_methods = {
-            "match_highlights": self.filter_match_highlights,
-            "highlights": self.filter_highlights,
-            "full_match": self.filter_full_match,
-            "live_stream": self.filter_live_stream,
-            "press_conference": self.filter_press_conference,
-            "reaction": self.filter_reaction,
-        }
+        result = self._partition(videos, filters)
+
+        if result["removed"]:
+            logger.info(f"apply_filters: removed {len(result['removed'])} videos")
+
+        return result
+
+    def filter_pipeline(
+        self, videos: list[dict], filters: list[str]
+    ) -> dict[str, list[dict]]:
+        """
+        重複排除 → フィルタ → 信頼チャンネル優先ソート をまとめて適用
+
+        重複分のフィルタ判定を省くため、重複排除を最初に行う。
+
+        Args:
+            videos: 動画リスト
+            filters: 適用するフィルタ名のリスト
 
-        all_removed = []
-        current = videos
+        Returns:
+            {"kept": [...], "removed": [...]}
+        """
+        result = self.apply_filters(self.deduplicate(videos), filters)
+        result["kept"] = self.sort_trusted(result["kept"])
+        return result
 
-        for filter_name in filters:
-            if filter_name in filter_methods:
-                result = filter_methods[filter_name](current)
-                current = result["kept"]
-                all_removed.extend(result["removed"])
+    def _partition(
+        self, videos: list[dict], filters: list[str]
+    ) -> dict[str, list[dict]]:
+        """指定フィルタで kept/removed に振り分ける（最初にマッチしたフィルタが除外理由）"""
+        combined = _combined_filter_pattern(tuple(filters))
+        if combined is None:
+            # 有効なフィルタが1つもなければ判定せずに全件残す
+            return {"kept": list(videos), "removed": []}
+
+        patterns = [
+            (name, _FILTER_PATTERNS[name])
+            for name in filters
+            if name in _FILTER_PATTERNS
+        ]
 
-        if all_removed:
-            logger.info(f"apply_filters: removed {len(all_removed)} videos")
+        kept, removed = [], []
+        for v in videos:
+            text = _filter_text(v)
+            if not combined.search(text):
+                kept.append(v)
+                continue
+            # 除外理由は指定順で最初にマッチしたフィルタ
+            # 入力の辞書にそのまま付与する（コピーしない）
+            v["filter_reason"] = next(
+                name for name, pattern in patterns if pattern.search(text)
+            )
+            removed.append(v)
 
-        return {"kept": current, "removed": all_removed}
+        return {"kept": kept, "removed": removed}
 
     # ========== 後方互換性: 旧メソッド ==========
 
@@ -183,33 +220,36 @@ class YouTubePostFilter:
         信頼チャンネル優先でソート + バッジ付与
         """
         for v in videos:
-            channel_id = v.get("channel_id", "")
-            v["is_trusted"] = is_trusted_channel(channel_id)
+            # 信頼判定とメタデータ取得を1回の参照で済ませる
+            info = get_trusted_channel_info(v.get("channel_id", ""))
+            v["is_trusted"] = info is not None
 
-            if v["is_trusted"]:
-                info = get_channel_info(channel_id)
+            if info is not None:
                 v["channel_display"] = f"✅ {info['name']}"
             else:
                 v["channel_display"] = f"⚠️ {v.get('channel_name', 'Unknown')}"
 
         # ソート: 信頼チャンネル優先、その中では公開日時が新しい順（降順）
-        # 安定ソートを利用して、まず日時で降順ソートし、次に信頼フラグで昇順（0:Trusted, 1:Untrusted）ソートする
-        videos.sort(key=lambda v: v.get("published_at", ""), reverse=True)
-        videos.sort(key=lambda v: 0 if v["is_trusted"] else 1)
+        # (信頼フラグ, 公開日時) の複合キーで1回だけ降順ソートする（reverse=True でも安定）
+        videos.sort(
+            key=lambda v: (v["is_trusted"], v.get("published_at", "")), reverse=True
+        )
 
         return videos
 
     def deduplicate(self, videos: list[dict]) -> list[dict]:
         """
-        重複排除（video_id ベース）
+        重複排除（video_id ベース、最初に出現した動画を残す）
+
+        フィルタのコストを重複分だけ余計に払わないよう、apply_filters() /
+        sort_trusted() より前に適用する。
         """
-        seen = set()
-        unique = []
+        unique_by_id: dict[str, dict] = {}
         for v in videos:
             video_id = v.get("video_id")
-            if video_id and video_id not in seen:
-                seen.add(video_id)
-                unique.append(v)
+            if video_id:
+                unique_by_id.setdefault(video_id, v)
+        unique = list(unique_by_id.values())
 
         if len(videos) != len(unique):
             logger.info(f"deduplicate: removed {len(videos) - len(unique)} duplicates")
@@ -235,25 +275,78 @@ class YouTubePostFilter:
         Returns:
             {"kept": [...], "removed": [...]}
         """
-        if not videos:
-            return {"kept": [], "removed": []}
-
-        # 入力データを構築（最大20件に制限してトークン節約）
-        MAX_VIDEOS_FOR_LLM = 20
-        candidates = videos[:MAX_VIDEOS_FOR_LLM]
-
-        video_data = []
-        for i, v in enumerate(candidates):
-            video_data.append(
-                {
-                    "id": i,
-                    "title": v.get("title", ""),
-                    "channel": v.get("channel_name", ""),
-                }
+        if self._skip_context_filter(videos, home_team, away_team):
+            return {"kept": videos, "removed": []}
+
+        try:
+            result = self._request_context_filter(
+                self._build_video_data(videos), home_team, away_team, gemini_client
+            )
+            return self._apply_context_result(videos, result, home_team, away_team)
+
+        except json.JSONDecodeError as e:
+            logger.warning(f"[LLM FILTER] JSON parse error: {e}. Skipping LLM filter.")
+            return {"kept": videos, "removed": []}
+        except Exception as e:
+            logger.error(f"[LLM FILTER] Error: {e}. Skipping LLM filter.")
+            return {"kept": videos, "removed": []}
+
+    def _skip_context_filter(
+        self, videos: list[dict], home_team: str, away_team: str
+    ) -> bool:
+        """候補が少なくLLMフィルタを省略するかどうか"""
+        if len(videos) > self.MIN_VIDEOS_FOR_LLM:
+            return False
+        if videos:
+            logger.info(
+                f"[LLM FILTER] {home_team} vs {away_team}: skipped (n={len(videos)})"
             )
+        return True
+
+    def _build_video_data(self, videos: list[dict]) -> list[dict]:
+        """プロンプトに埋め込む先頭 MAX_VIDEOS_FOR_LLM 件の動画リスト（idは位置）"""
+        return [
+            {
+                "id": i,
+                "title": v.get("title", ""),
+                "channel": v.get("channel_name", ""),
+            }
+            for i, v in enumerate(islice(videos, self.MAX_VIDEOS_FOR_LLM))
+        ]
+
+    def _apply_context_result(
+        self, videos: list[dict], result: dict, home_team: str, away_team: str
+    ) -> dict[str, list[dict]]:
+        """LLMの判定結果（kept_indices）で kept/removed に振り分ける"""
+        candidate_count = min(len(videos), self.MAX_VIDEOS_FOR_LLM)
+        kept_indices = set(result.get("kept_indices", []))
+        reasoning = result.get("reasoning", "")
 
-        import json
+        logger.info(
+            f"[LLM FILTER] {home_team} vs {away_team}: kept {len(kept_indices)}/{candidate_count} videos. Reason: {reasoning}"
+        )
 
+        kept = []
+        removed = []
+
+        for i in range(candidate_count):
+            v = videos[i]
+            if i in kept_indices:
+                kept.append(v)
+            else:
+                v["filter_reason"] = "llm_context_filter"
+                removed.append(v)
+
+        # MAX_VIDEOS_FOR_LLM を超えた動画はそのまま残す（保守的に）
+        if len(videos) > candidate_count:
+            kept.extend(videos[candidate_count:])
+
+        return {"kept": kept, "removed": removed}
+
+    def _request_context_filter(
+        self, video_data: list[dict], home_team: str, away_team: str, gemini_client
+    ) -> dict:
+        """Geminiに直接対決の判定を依頼し、レスポンスJSONを辞書で返す"""
         video_json = json.dumps(video_data, ensure_ascii=False)
 
         prompt = f"""あなたはサッカー動画のフィルタリング担当者です。
@@ -276,47 +369,5 @@ class YouTubePostFilter:
 
 kept_indicesには残すべき動画のid（数字）のリストを入れてください。"""
 
-        try:
-            response_text = gemini_client.generate_content(prompt).strip()
-
-            # マークダウンコードブロックを除去
-            if response_text.startswith("```"):
-                lines = response_text.split("\n")
-                # 最初と最後の``` を除去
-                if lines[0].startswith("```"):
-                    lines = lines[1:]
-                if lines and lines[-1].strip() == "```":
-                    lines = lines[:-1]
-                response_text = "\n".join(lines)
-
-            result = json.loads(response_text)
-            kept_indices = set(result.get("kept_indices", []))
-            reasoning = result.get("reasoning", "")
-
-            logger.info(
-                f"[LLM FILTER] {home_team} vs {away_team}: kept {len(kept_indices)}/{len(candidates)} videos. Reason: {reasoning}"
-            )
-
-            kept = []
-            removed = []
-
-            for i, v in enumerate(candidates):
-                if i in kept_indices:
-                    kept.append(v)
-                else:
-                    vv = dict(v)
-                    vv["filter_reason"] = "llm_context_filter"
-                    removed.append(vv)
-
-            # MAX_VIDEOS_FOR_LLM を超えた動画はそのまま残す（保守的に）
-            if len(videos) > MAX_VIDEOS_FOR_LLM:
-                kept.extend(videos[MAX_VIDEOS_FOR_LLM:])
-
-            return {"kept": kept, "removed": removed}
-
-        except json.JSONDecodeError as e:
-            logger.warning(f"[LLM FILTER] JSON parse error: {e}. Skipping LLM filter.")
-            return {"kept": videos, "removed": []}
-        except Exception as e:
-            logger.error(f"[LLM FILTER] Error: {e}. Skipping LLM filter.")
-            return {"kept": videos, "removed": []}
+        response_text = gemini_client.generate_content(prompt).strip()
+        return json.loads(_strip_code_fence(response_text))
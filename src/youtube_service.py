@@ -8,9 +8,12 @@ Issue #27: クエリ削減（20→13/試合）とpost-fetchフィルタ方式へ
 Issue #102:検索/キャッシュはYouTubeSearchClientに統一
 """
 
+import concurrent.futures
 import logging
+import threading
+from collections import defaultdict
 from collections.abc import Callable
-from datetime import datetime
+from datetime import UTC, datetime
 
 from config import config
 from settings.channels import (
@@ -24,10 +27,12 @@ from settings.search_specs import (
     get_youtube_allowed_channel_categories,
     get_youtube_max_display,
     get_youtube_time_window,
+    get_youtube_time_windows,
 )
-from src.clients.http_client import HttpClient
+from src.clients.http_client import HTTP_POOL_MAXSIZE, HttpClient
 from src.clients.youtube_client import YouTubeSearchClient
 from src.domain.models import MatchAggregate
+from src.utils.datetime_util import DateTimeUtil
 from src.youtube_filter import YouTubePostFilter
 
 logger = logging.getLogger(__name__)
@@ -41,6 +46,14 @@ class YouTubeService:
     # 検索パラメータは settings/search_specs.py で管理
     # 全カテゴリ共通: 取得件数（フィルタ後に絞り込む）
     FETCH_MAX_RESULTS = 50
+    # 結果に含めるカテゴリ（この順序で並べる）
+    CATEGORIES = ("press_conference", "historic", "tactical", "player_highlight")
+    # 1試合分の検索（記者会見・過去対戦・戦術・選手紹介）を並列実行する際の最大同時実行数
+    MAX_SEARCH_WORKERS = 8
+    # 複数試合の動画取得を並列実行する際の最大同時実行数
+    # 試合内の検索並列と掛け合わせた同時GET数が共有Sessionの接続プール上限を超えないようにする
+    # （超過分の接続は使い捨てになり keep-alive が効かない）
+    MAX_MATCH_WORKERS = max(1, HTTP_POOL_MAXSIZE // MAX_SEARCH_WORKERS)
 
     def __init__(
         self,
@@ -53,8 +66,9 @@ class YouTubeService:
         # モック/テスト用の上書き関数
         self._search_override = search_override
 
-        # Issue #107: search_override呼び出し回数
+        # Issue #107: search_override呼び出し回数（検索は並列実行されるためロックで保護）
         self._override_call_count = 0
+        self._override_count_lock = threading.Lock()
 
         # キャッシュ設定（clientに渡す）
         effective_cache_enabled = (
@@ -113,7 +127,8 @@ class YouTubeService:
         # モック/テスト用の上書きがある場合はここで返す（Issue #107: 統計も更新）
         if self._search_override:
             try:
-                self._override_call_count += 1
+                with self._override_count_lock:
+                    self._override_call_count += 1
                 result = self._search_override(
                     {
                         "query": query,
@@ -178,6 +193,7 @@ class YouTubeService:
         title_keywords: list[str],
         category: str,
         require_all_keywords: bool = False,
+        query_label: str | None = None,
     ) -> list[dict]:
         """
         複数チャンネルのuploadsプレイリストから動画を取得・フィルタ
@@ -188,6 +204,7 @@ class YouTubeService:
             title_keywords: タイトルに含まれるべきキーワード（OR条件、require_all_keywords=True でAND）
             category: 動画カテゴリ
             require_all_keywords: Trueならキーワードを全て含む動画のみ残す
+            query_label: 動画カードに表示する検索ラベル（指定時は category と同時に付与）
         """
         results = []
         seen_ids = set()
@@ -213,6 +230,8 @@ class YouTubeService:
                             continue
                 seen_ids.add(vid_id)
                 v["category"] = category
+                if query_label is not None:
+                    v["query_label"] = query_label
                 info = get_channel_info(v.get("channel_id", channel_id))
                 v["is_trusted"] = True
                 v["channel_display"] = f"✅ {info['name']}"
@@ -312,9 +331,8 @@ class YouTubeService:
             published_before=published_before,
             title_keywords=keywords,
             category=category,
+            query_label=manager_name or team_name,
         )
-        for v in kept:
-            v["query_label"] = manager_name or team_name
 
         return {"kept": kept, "removed": []}
 
@@ -334,21 +352,31 @@ class YouTubeService:
             {"kept": [...], "removed": [...]}
         """
         category = "historic"
-        published_after, published_before = get_youtube_time_window(category, kickoff_time)
+        windows = get_youtube_time_windows(category, kickoff_time)
         query = build_youtube_query(category, home_team=home_team, away_team=away_team)
 
-        videos = self._search_videos(
-            query=query,
-            published_after=published_after,
-            published_before=published_before,
-            max_results=self.FETCH_MAX_RESULTS,
-        )
+        def search_window(window: tuple[datetime, datetime]) -> list[dict]:
+            return self._search_videos(
+                query=query,
+                published_after=window[0],
+                published_before=window[1],
+                max_results=self.FETCH_MAX_RESULTS,
+            )
+
+        if len(windows) == 1:
+            videos = search_window(windows[0])
+        else:
+            # 期間分割時は各ウィンドウを並列検索し、video_idで統合
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=len(windows)
+            ) as executor:
+                batches = list(executor.map(search_window, windows))
+            videos = self.filter.deduplicate([v for batch in batches for v in batch])
         for v in videos:
             v["category"] = category
 
         # 許可カテゴリかつ両チーム名のいずれかがタイトルに含まれるもののみ残す
         allowed_cats = get_youtube_allowed_channel_categories(category)
-        from settings.channels import get_channel_info as _get_info
 
         home_variants = get_team_name_variants(home_team)
         away_variants = get_team_name_variants(away_team)
@@ -356,7 +384,7 @@ class YouTubeService:
         kept = []
         removed = []
         for v in videos:
-            info = _get_info(v.get("channel_id", ""))
+            info = get_channel_info(v.get("channel_id", ""))
             title_lower = v.get("title", "").lower()
             channel_ok = info["category"] in allowed_cats
             # 両チーム名が両方含まれる動画のみ（対戦を示すタイトル）
@@ -401,9 +429,8 @@ class YouTubeService:
             published_before=published_before,
             title_keywords=team_variants,
             category=category,
+            query_label=team_name,
         )
-        for v in kept:
-            v["query_label"] = team_name
 
         return {"kept": kept, "removed": []}
 
@@ -437,9 +464,8 @@ class YouTubeService:
             published_before=published_before,
             title_keywords=keywords,
             category=category,
+            query_label=player_name,
         )
-        for v in kept:
-            v["query_label"] = player_name
 
         return {"kept": kept, "removed": []}
 
@@ -456,21 +482,9 @@ class YouTubeService:
         """
         player_count = 2 if config.DEBUG_MODE else 3
 
-        home_players = []
-        away_players = []
-
-        # ホームチーム - リストから取得（FW/MF優先は形式的）
-        if match.facts.home_lineup:
-            # スタメンリストから後ろの方（FW想定）を優先
-            for player in reversed(match.facts.home_lineup):
-                if len(home_players) < player_count:
-                    home_players.append(player)
-
-        # アウェイチーム
-        if match.facts.away_lineup:
-            for player in reversed(match.facts.away_lineup):
-                if len(away_players) < player_count:
-                    away_players.append(player)
+        # スタメンリストの後ろから player_count 人（FW想定、FW/MF優先は形式的）
+        home_players = (match.facts.home_lineup or [])[-player_count:][::-1]
+        away_players = (match.facts.away_lineup or [])[-player_count:][::-1]
 
         return home_players, away_players
 
@@ -482,85 +496,89 @@ class YouTubeService:
 
         home_team = match.core.home_team
         away_team = match.core.away_team
+        # 複数試合を並列処理するため、ログには試合名を付ける
+        match_label = f"{home_team} vs {away_team}"
         home_manager = match.facts.home_manager
         away_manager = match.facts.away_manager
 
         # Issue #70: kickoff_at_utc を優先使用
-        import pytz
-
-        from src.utils.datetime_util import DateTimeUtil
-
         if match.core.kickoff_at_utc is not None:
             kickoff_time = match.core.kickoff_at_utc
             logger.info(
-                f"Kickoff time (from kickoff_at_utc): {kickoff_time.strftime('%Y-%m-%dT%H:%M:%SZ')}"
+                f"[{match_label}] Kickoff time (from kickoff_at_utc): {kickoff_time.strftime('%Y-%m-%dT%H:%M:%SZ')}"
             )
         else:
             # フォールバック: kickoff_jst 文字列をパース
             kickoff_time = DateTimeUtil.parse_kickoff_jst(match.core.kickoff_jst)
             if kickoff_time:
                 logger.info(
-                    f"Kickoff time (parsed from kickoff_jst): {match.core.kickoff_jst} -> UTC: {kickoff_time.strftime('%Y-%m-%dT%H:%M:%SZ')}"
+                    f"[{match_label}] Kickoff time (parsed from kickoff_jst): {match.core.kickoff_jst} -> UTC: {kickoff_time.strftime('%Y-%m-%dT%H:%M:%SZ')}"
                 )
             else:
                 logger.warning(
-                    f"Failed to parse kickoff_jst: {match.core.kickoff_jst}, using current time"
+                    f"[{match_label}] Failed to parse kickoff_jst: {match.core.kickoff_jst}, using current time"
                 )
-                kickoff_time = datetime.now(pytz.UTC)
+                kickoff_time = datetime.now(UTC)
 
-        logger.info(f"Fetching YouTube videos for {home_team} vs {away_team}")
+        logger.info(f"Fetching YouTube videos for {match_label}")
         if home_manager:
-            logger.info(f"Home manager: {home_manager}")
+            logger.info(f"[{match_label}] Home manager: {home_manager}")
         if away_manager:
-            logger.info(f"Away manager: {away_manager}")
+            logger.info(f"[{match_label}] Away manager: {away_manager}")
 
         # キープレイヤーを取得
         home_players, away_players = self._get_key_players(match)
-        logger.info(f"Key players - Home: {home_players}, Away: {away_players}")
-
-        # ヘルパー: 結果をマージ
-        def merge_result(result: dict[str, list[dict]]):
-            all_kept.extend(result.get("kept", []))
-            all_removed.extend(result.get("removed", []))
-            all_overflow.extend(result.get("overflow", []))
+        logger.info(
+            f"[{match_label}] Key players - Home: {home_players}, Away: {away_players}"
+        )
 
-        # 1. 記者会見（各チームのチャンネルから取得）
-        merge_result(
-            self._search_press_conference(home_team, home_manager, kickoff_time)
+        # 検索タスク一覧（この順序で結果をマージする）
+        search_tasks = [
+            # 1. 記者会見（各チームのチャンネルから取得）
+            (self._search_press_conference, home_team, home_manager, kickoff_time),
+            (self._search_press_conference, away_team, away_manager, kickoff_time),
+            # 2. 過去の対戦（UNEXT・チーム・リーグ・放送局から取得）
+            (self._search_historic_clashes, home_team, away_team, kickoff_time),
+            # 3. 戦術（tactics・mediaチャンネルから取得）
+            (self._search_tactical, home_team, kickoff_time),
+            (self._search_tactical, away_team, kickoff_time),
+        ]
+        # 4. 選手紹介（UNEXT・チーム・リーグから取得、デバッグモードは1人/チーム）
+        search_tasks.extend(
+            (self._search_player_highlight, player, home_team, kickoff_time)
+            for player in home_players
         )
-        merge_result(
-            self._search_press_conference(away_team, away_manager, kickoff_time)
+        search_tasks.extend(
+            (self._search_player_highlight, player, away_team, kickoff_time)
+            for player in away_players
         )
 
-        # 2. 過去の対戦（UNEXT・チーム・リーグ・放送局から取得）
-        merge_result(self._search_historic_clashes(home_team, away_team, kickoff_time))
-
-        # 3. 戦術（tactics・mediaチャンネルから取得）
-        merge_result(self._search_tactical(home_team, kickoff_time))
-        merge_result(self._search_tactical(away_team, kickoff_time))
-
-        # 4. 選手紹介（UNEXT・チーム・リーグから取得、デバッグモードは1人/チーム）
-        for player in home_players:
-            merge_result(self._search_player_highlight(player, home_team, kickoff_time))
-        for player in away_players:
-            merge_result(self._search_player_highlight(player, away_team, kickoff_time))
+        # 各検索はHTTP待ちが大半で互いに独立しているため並列実行する
+        # 全タスクを submit してから result() を待ち、タスク順でマージする（重複排除の優先順位を維持）
+        max_workers = min(len(search_tasks), self.MAX_SEARCH_WORKERS)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(*task) for task in search_tasks]
+            for future in futures:
+                result = future.result()
+                all_kept.extend(result.get("kept", []))
+                all_removed.extend(result.get("removed", []))
+                all_overflow.extend(result.get("overflow", []))
 
         # 重複排除（keptのみ）
         unique_kept = self.filter.deduplicate(all_kept)
 
         # カテゴリ別にグルーピングしてmax_display件制限
-        categories = [
-            "press_conference",
-            "historic",
-            "tactical",
-            "player_highlight",
-        ]
         final_kept = []
         final_overflow = []
 
-        for category in categories:
+        # 1回の走査でカテゴリ別に振り分ける
+        videos_by_category = defaultdict(list)
+        for v in unique_kept:
+            videos_by_category[v.get("category")].append(v)
+
+        for category in self.CATEGORIES:
             max_display = get_youtube_max_display(category)
-            cat_videos = [v for v in unique_kept if v.get("category") == category]
+            cat_videos = videos_by_category.get(category)
             if cat_videos:
                 cat_videos = sorted(cat_videos, key=lambda v: v.get("published_at", ""), reverse=True)
                 final_kept.extend(cat_videos[:max_display])
@@ -579,7 +597,7 @@ class YouTubeService:
         if config.USE_MOCK_DATA:
             return self._get_mock_videos(matches)
 
-        results = {}
+        target_matches = []
 
         for match in matches:
             if match.core.is_target:
@@ -589,10 +607,22 @@ class YouTubeService:
                         f"Skipping YouTube search for low-rank match: {match.core.home_team} vs {match.core.away_team} (rank={match.core.rank})"
                     )
                     continue
-                match_key = f"{match.core.home_team} vs {match.core.away_team}"
-                results[match_key] = self.get_videos_for_match(match)
-
-        return results
+                target_matches.append(match)
+
+        if not target_matches:
+            return {}
+
+        # 試合ごとの動画取得は独立しているため並列実行（入力順を維持して返す）
+        max_workers = min(len(target_matches), self.MAX_MATCH_WORKERS)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self.get_videos_for_match, match)
+                for match in target_matches
+            ]
+            return {
+                f"{match.core.home_team} vs {match.core.away_team}": future.result()
+                for match, future in zip(target_matches, futures)
+            }
 
     def _get_mock_videos(self, matches: list[MatchAggregate]) -> dict[str, list[dict]]:
         """モック用YouTube動画データを取得"""
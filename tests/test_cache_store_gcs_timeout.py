@@ -1,6 +1,8 @@
 import unittest
 from unittest.mock import MagicMock, patch
 
+from google.api_core.exceptions import NotFound
+
 from src.clients import cache_store
 from src.clients.cache_store import GcsCacheStore
 
@@ -27,20 +29,25 @@ class TestGcsCacheStoreTimeout(unittest.TestCase):
 
     def test_read_passes_timeout_to_gcs_operations(self):
         blob = MagicMock()
-        blob.exists.return_value = True
         blob.download_as_text.return_value = '{"ok": true}'
         store, storage_module = self._store_with_blob(blob)
 
         with patch.dict("sys.modules", {"google.cloud.storage": storage_module}):
             self.assertEqual(store.read("fixtures/id_1540841.json"), {"ok": True})
 
-        blob.exists.assert_called_once_with(
-            timeout=cache_store.GCS_OPERATION_TIMEOUT_SECONDS
-        )
+        blob.exists.assert_not_called()
         blob.download_as_text.assert_called_once_with(
             timeout=cache_store.GCS_OPERATION_TIMEOUT_SECONDS
         )
 
+    def test_read_returns_none_for_missing_blob(self):
+        blob = MagicMock()
+        blob.download_as_text.side_effect = NotFound("missing")
+        store, storage_module = self._store_with_blob(blob)
+
+        with patch.dict("sys.modules", {"google.cloud.storage": storage_module}):
+            self.assertIsNone(store.read("fixtures/id_0.json"))
+
     def test_write_passes_timeout_to_gcs_operation(self):
         blob = MagicMock()
         store, storage_module = self._store_with_blob(blob)
@@ -0,0 +1,34 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.clients.cache_store import LocalCacheStore
+
+
+class TestLocalCacheStore(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.store = LocalCacheStore(Path(self._tmp.name))
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_read_missing_returns_none(self):
+        self.assertIsNone(self.store.read("players/missing.json"))
+
+    def test_write_creates_subdirectories_and_round_trips(self):
+        data = {"name": "三笘 薫", "id": 1}
+
+        self.store.write("players/Brighton/1.json", data)
+
+        self.assertEqual(self.store.read("players/Brighton/1.json"), data)
+
+    def test_write_is_compact_and_keeps_non_ascii(self):
+        self.store.write("names/1.json", {"name": "三笘 薫", "id": 1})
+
+        raw = (Path(self._tmp.name) / "names/1.json").read_text(encoding="utf-8")
+        self.assertEqual(raw, '{"name":"三笘 薫","id":1}')
+
+
+if __name__ == "__main__":
+    unittest.main()
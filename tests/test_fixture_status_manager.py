@@ -0,0 +1,149 @@
+import csv
+import io
+import unittest
+from datetime import UTC, datetime
+from unittest.mock import MagicMock
+
+from src.utils.fixture_status_manager import FixtureStatusManager
+
+
+def _manager_with_csv(rows: list[dict]) -> tuple:
+    output = io.StringIO()
+    writer = csv.DictWriter(output, fieldnames=FixtureStatusManager.CSV_COLUMNS)
+    writer.writeheader()
+    writer.writerows(rows)
+
+    blob = MagicMock()
+    blob.exists.return_value = True
+    blob.download_as_text.return_value = output.getvalue()
+    bucket = MagicMock()
+    bucket.blob.return_value = blob
+
+    manager = FixtureStatusManager(bucket_name="test-bucket")
+    manager._bucket = bucket
+    return manager, blob
+
+
+class TestFixtureStatusManagerBatch(unittest.TestCase):
+    def _uploaded_rows(self, blob) -> dict[str, dict]:
+        content = blob.upload_from_string.call_args.args[0]
+        return {row["fixture_id"]: row for row in csv.DictReader(io.StringIO(content))}
+
+    def test_mark_processing_batch_writes_once(self):
+        manager, blob = _manager_with_csv([])
+        kickoff = datetime.now(UTC)
+
+        self.assertTrue(manager.mark_processing_batch([(1, kickoff), (2, kickoff)]))
+
+        blob.download_as_text.assert_called_once()
+        blob.upload_from_string.assert_called_once()
+        rows = self._uploaded_rows(blob)
+        self.assertEqual(set(rows), {"1", "2"})
+        self.assertEqual(rows["1"]["status"], FixtureStatusManager.STATUS_PROCESSING)
+        self.assertEqual(rows["2"]["attempts"], "0")
+
+    def test_mark_failed_batch_increments_existing_attempts(self):
+        today = datetime.now(UTC).strftime("%Y-%m-%d")
+        manager, blob = _manager_with_csv(
+            [
+                {
+                    "fixture_id": "1",
+                    "date": today,
+                    "kickoff_jst": f"{today}T20:00:00+09:00",
+                    "status": FixtureStatusManager.STATUS_PROCESSING,
+                    "first_attempt_at": "",
+                    "last_attempt_at": "",
+                    "attempts": "1",
+                    "error_message": "",
+                }
+            ]
+        )
+
+        self.assertTrue(manager.mark_failed_batch(["1", "2"], "boom"))
+
+        blob.upload_from_string.assert_called_once()
+        rows = self._uploaded_rows(blob)
+        self.assertEqual(rows["1"]["status"], FixtureStatusManager.STATUS_FAILED)
+        self.assertEqual(rows["1"]["attempts"], "2")
+        self.assertEqual(rows["1"]["error_message"], "boom")
+        self.assertEqual(rows["2"]["attempts"], "1")
+
+    def test_mark_partial_batch_keeps_attempts(self):
+        manager, blob = _manager_with_csv([])
+
+        manager.mark_partial_batch([("3", "home_lineup")])
+
+        rows = self._uploaded_rows(blob)
+        self.assertEqual(rows["3"]["status"], FixtureStatusManager.STATUS_PARTIAL)
+        self.assertEqual(rows["3"]["attempts"], "0")
+        self.assertEqual(rows["3"]["error_message"], "Missing: home_lineup")
+
+
+class TestFixtureStatusManagerReadCache(unittest.TestCase):
+    def test_lookups_reuse_downloaded_csv(self):
+        manager, blob = _manager_with_csv(
+            [
+                {
+                    "fixture_id": "1",
+                    "date": "",
+                    "kickoff_jst": "",
+                    "status": FixtureStatusManager.STATUS_COMPLETE,
+                    "first_attempt_at": "",
+                    "last_attempt_at": "",
+                    "attempts": "0",
+                    "error_message": "",
+                }
+            ]
+        )
+
+        self.assertFalse(manager.is_processable("1"))
+        self.assertEqual(manager.get_status("1"), FixtureStatusManager.STATUS_COMPLETE)
+        self.assertTrue(manager.is_processable("2"))
+
+        blob.download_as_text.assert_called_once()
+
+    def test_get_records_returns_only_existing_ids(self):
+        manager, blob = _manager_with_csv(
+            [
+                {
+                    "fixture_id": "1",
+                    "date": "",
+                    "kickoff_jst": "",
+                    "status": FixtureStatusManager.STATUS_FAILED,
+                    "first_attempt_at": "",
+                    "last_attempt_at": "",
+                    "attempts": str(FixtureStatusManager.MAX_RETRY_ATTEMPTS),
+                    "error_message": "",
+                }
+            ]
+        )
+
+        records = manager.get_records([1, 2])
+
+        self.assertEqual(set(records), {"1"})
+        self.assertFalse(manager.is_record_processable(1, records["1"]))
+        self.assertTrue(manager.is_record_processable(2, records.get("2")))
+        blob.download_as_text.assert_called_once()
+
+    def test_updates_always_read_fresh_csv(self):
+        manager, blob = _manager_with_csv([])
+
+        manager.get_status("1")
+        manager.mark_complete("1")
+
+        self.assertEqual(blob.download_as_text.call_count, 2)
+        self.assertEqual(manager.get_status("1"), FixtureStatusManager.STATUS_COMPLETE)
+        self.assertEqual(blob.download_as_text.call_count, 2)
+
+    def test_failed_write_does_not_leave_unsaved_status_in_cache(self):
+        manager, blob = _manager_with_csv([])
+        blob.upload_from_string.side_effect = RuntimeError("upload failed")
+
+        self.assertFalse(manager.mark_complete("1"))
+
+        self.assertIsNone(manager.get_status("1"))
+        self.assertEqual(blob.download_as_text.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
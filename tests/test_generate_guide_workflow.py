@@ -0,0 +1,89 @@
+import concurrent.futures
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.workflows import generate_guide_workflow
+from src.workflows.generate_guide_workflow import GenerateGuideWorkflow
+
+
+def _workflow() -> GenerateGuideWorkflow:
+    workflow = GenerateGuideWorkflow()
+    workflow._background_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    workflow._background_futures = []
+    return workflow
+
+
+class TestGenerateGuideWorkflowFinalize(unittest.TestCase):
+    def test_status_update_failure_propagates(self):
+        workflow = _workflow()
+        status_manager = MagicMock()
+
+        with (
+            patch.object(
+                workflow,
+                "_update_fixture_statuses",
+                side_effect=RuntimeError("gcs down"),
+            ),
+            patch.object(workflow, "_run_cache_warming") as run_cache_warming,
+            self.assertRaises(RuntimeError),
+        ):
+            workflow._step_finalize([], [], status_manager, {})
+
+        run_cache_warming.assert_not_called()
+        workflow._wait_background_tasks()
+
+    def test_quota_is_written_before_cache_warming_starts(self):
+        workflow = _workflow()
+        calls = []
+
+        with (
+            patch.object(
+                workflow,
+                "_write_quota_info",
+                side_effect=lambda: calls.append("quota"),
+            ),
+            patch.object(
+                workflow,
+                "_run_cache_warming",
+                side_effect=lambda: calls.append("warming"),
+            ),
+        ):
+            workflow._step_finalize([], [], None, {})
+            workflow._wait_background_tasks()
+
+        self.assertEqual(calls, ["quota", "warming"])
+
+
+class TestGenerateGuideWorkflowRun(unittest.TestCase):
+    def test_debug_email_is_sent_after_background_work(self):
+        workflow = GenerateGuideWorkflow()
+        match = MagicMock()
+        calls = []
+
+        with (
+            patch.object(generate_guide_workflow, "prefetch_remote_manifest"),
+            patch.object(workflow, "_log_execution_info"),
+            patch.object(
+                workflow, "_step_select_matches", return_value=([match], [match], None)
+            ),
+            patch.object(workflow, "_step_enrich_data", return_value=({}, {})),
+            patch.object(workflow, "_step_generate_reports", return_value=[]),
+            patch.object(workflow, "_write_quota_info"),
+            patch.object(
+                workflow,
+                "_run_cache_warming",
+                side_effect=lambda: calls.append("warming"),
+            ),
+            patch.object(
+                workflow,
+                "_send_debug_email",
+                side_effect=lambda *args: calls.append("email"),
+            ),
+        ):
+            workflow.run()
+
+        self.assertEqual(calls, ["warming", "email"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,8 @@
 import json
 import unittest
 
-from src.clients.http_client import CachedResponse, HttpResponse
+from src.clients import http_client
+from src.clients.http_client import CachedResponse, HttpResponse, RequestsHttpClient
 
 
 class TestHttpResponse(unittest.TestCase):
@@ -42,5 +43,23 @@ class TestHttpResponse(unittest.TestCase):
         self.assertEqual(json.loads(response.text), data)
 
 
+class TestRequestsHttpClientRetry(unittest.TestCase):
+    def test_adapter_retries_transient_5xx_for_get_only(self):
+        client = RequestsHttpClient()
+
+        retry = client.session.get_adapter("https://example.com").max_retries
+
+        self.assertEqual(retry.status, http_client.HTTP_STATUS_RETRY_TOTAL)
+        self.assertEqual(retry.connect, 0)
+        self.assertEqual(retry.read, 0)
+        self.assertEqual(
+            set(retry.status_forcelist), set(http_client.HTTP_STATUS_RETRY_FORCELIST)
+        )
+        self.assertTrue(retry.is_retry("GET", 503))
+        self.assertFalse(retry.is_retry("POST", 503))
+        self.assertFalse(retry.is_retry("GET", 403))
+        self.assertFalse(retry.raise_on_status)
+
+
 if __name__ == "__main__":
     unittest.main()
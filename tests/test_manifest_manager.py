@@ -2,6 +2,7 @@ import json
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import MagicMock
 
 from src.manifest_manager import (
     ManifestManager,
@@ -196,6 +197,42 @@ class TestManifestManager(unittest.TestCase):
             self.assertEqual(len(matches), 1)
             self.assertEqual(matches[0]["file"], new_file)
 
+    def test_merge_remote_uses_prefetched_manifest_without_fetching(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manifest_path = Path(temp_dir) / "manifest.json"
+            manifest_path.write_text(
+                json.dumps(
+                    {
+                        "reports_by_date": {
+                            "2026-03-08": {
+                                "matches": [{"fixture_id": 2, "file": "local.html"}]
+                            }
+                        }
+                    }
+                ),
+                encoding="utf-8",
+            )
+            firebase_client = MagicMock()
+            manager = ManifestManager(
+                manifest_path=manifest_path, firebase_client=firebase_client
+            )
+
+            merged = manager.merge_remote(
+                {
+                    "reports_by_date": {
+                        "2026-03-08": {
+                            "matches": [{"fixture_id": 1, "file": "remote.html"}]
+                        }
+                    }
+                }
+            )
+
+            firebase_client.fetch_manifest.assert_not_called()
+            self.assertEqual(
+                [m["file"] for m in merged["reports_by_date"]["2026-03-08"]["matches"]],
+                ["remote.html", "local.html"],
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,80 @@
+import json
+import unittest
+from unittest.mock import MagicMock
+
+from src.clients.http_client import HttpResponse
+from src.clients.youtube_client import YouTubeSearchClient
+
+
+def _playlist_response(video_ids: list[str]) -> HttpResponse:
+    items = [
+        {
+            "snippet": {
+                "title": f"video {video_id}",
+                "resourceId": {"videoId": video_id},
+                "publishedAt": "2025-01-01T00:00:00Z",
+            }
+        }
+        for video_id in video_ids
+    ]
+    return HttpResponse(
+        status_code=200,
+        content=json.dumps({"items": items}).encode(),
+    )
+
+
+class TestYouTubeSearchClientPlaylistMemo(unittest.TestCase):
+    def test_same_playlist_is_fetched_once_and_copied(self):
+        http_client = MagicMock()
+        http_client.get.return_value = _playlist_response(["a", "b"])
+        client = YouTubeSearchClient(
+            api_key="dummy",
+            http_client=http_client,
+            cache_enabled=False,
+            cache_store=MagicMock(),
+        )
+
+        first = client.get_channel_playlist_videos("UC123")
+        first[0]["category"] = "press_conference"
+        second = client.get_channel_playlist_videos("UC123")
+
+        http_client.get.assert_called_once()
+        self.assertEqual(client.api_call_count, 1)
+        self.assertEqual([v["video_id"] for v in second], ["a", "b"])
+        self.assertNotIn("category", second[0])
+
+
+class TestYouTubeSearchClientSearchMemo(unittest.TestCase):
+    def test_identical_search_is_requested_once(self):
+        item = {
+            "id": {"videoId": "a"},
+            "snippet": {
+                "title": "Arsenal vs Spurs",
+                "channelId": "UC1",
+                "channelTitle": "Arsenal",
+                "thumbnails": {"medium": {"url": "http://example.com/a.jpg"}},
+                "publishedAt": "2025-01-01T00:00:00Z",
+            },
+        }
+        http_client = MagicMock()
+        http_client.get.return_value = HttpResponse(
+            status_code=200, content=json.dumps({"items": [item]}).encode()
+        )
+        client = YouTubeSearchClient(
+            api_key="dummy",
+            http_client=http_client,
+            cache_enabled=False,
+            cache_store=MagicMock(),
+        )
+
+        first = client.search("Arsenal vs Spurs highlights", max_results=50)
+        second = client.search("Arsenal vs Spurs highlights", max_results=50)
+        client.search("Arsenal vs Spurs highlights", max_results=10)
+
+        self.assertEqual(http_client.get.call_count, 2)
+        self.assertEqual(first, second)
+        self.assertIsNot(first[0], second[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
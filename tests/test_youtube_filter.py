@@ -0,0 +1,209 @@
+import unittest
+from unittest.mock import MagicMock
+
+from settings.channels import TRUSTED_CHANNELS
+from src.youtube_filter import YouTubePostFilter
+
+
+def _video(video_id: str, title: str, description: str = "") -> dict:
+    return {"video_id": video_id, "title": title, "description": description}
+
+
+class TestYouTubePostFilterApplyFilters(unittest.TestCase):
+    def setUp(self):
+        self.filter = YouTubePostFilter()
+
+    def test_first_matching_filter_in_order_is_the_reason(self):
+        videos = [
+            _video("1", "Arsenal vs Chelsea Highlights"),
+            _video("2", "Extended HIGHLIGHTS"),
+            _video("3", "Full Match Replay"),
+            _video("4", "Watch LIVE now"),
+            _video("5", "Pre-match press conference"),
+            _video("6", "Fan Reaction"),
+            _video("7", "Training session", "behind the scenes"),
+        ]
+
+        result = self.filter.apply_filters(
+            videos,
+            [
+                "match_highlights",
+                "highlights",
+                "full_match",
+                "live_stream",
+                "press_conference",
+                "reaction",
+            ],
+        )
+
+        self.assertEqual([v["video_id"] for v in result["kept"]], ["7"])
+        self.assertEqual(
+            {v["video_id"]: v["filter_reason"] for v in result["removed"]},
+            {
+                "1": "match_highlights",
+                "2": "highlights",
+                "3": "full_match",
+                "4": "live_stream",
+                "5": "press_conference",
+                "6": "reaction",
+            },
+        )
+
+    def test_match_highlights_needs_versus_marker(self):
+        videos = [
+            _video("1", "Highlights", "Arsenal v Spurs"),
+            _video("2", "Season highlights"),
+        ]
+
+        result = self.filter.filter_match_highlights(videos)
+
+        self.assertEqual([v["video_id"] for v in result["removed"]], ["1"])
+        self.assertEqual([v["video_id"] for v in result["kept"]], ["2"])
+
+    def test_live_stream_matches_live_as_a_word(self):
+        videos = [
+            _video("1", "LIVE: matchday build-up"),
+            _video("2", "Livestream replay"),
+            _video("3", "Liverpool training", "Ball delivery drills"),
+            _video("4", "【LIVE配信】プレミアリーグ"),
+            _video("5", "LIVE中継 アーセナル vs チェルシー"),
+        ]
+
+        result = self.filter.filter_live_stream(videos)
+
+        self.assertEqual(
+            [v["video_id"] for v in result["removed"]], ["1", "2", "4", "5"]
+        )
+        self.assertEqual([v["video_id"] for v in result["kept"]], ["3"])
+
+    def test_combined_filters_match_live_next_to_japanese(self):
+        videos = [_video("1", "ライブLIVE 配信中"), _video("2", "Liverpool 会見")]
+
+        result = self.filter.apply_filters(videos, ["highlights", "live_stream"])
+
+        self.assertEqual([v["video_id"] for v in result["removed"]], ["1"])
+        self.assertEqual(result["removed"][0]["filter_reason"], "live_stream")
+
+    def test_removed_videos_are_tagged_in_place(self):
+        video = _video("1", "Fan reaction")
+
+        result = self.filter.apply_filters([video], ["reaction"])
+
+        self.assertIs(result["removed"][0], video)
+        self.assertEqual(video["filter_reason"], "reaction")
+
+    def test_unknown_filter_names_are_ignored(self):
+        videos = [_video("1", "Full match")]
+
+        result = self.filter.apply_filters(videos, ["unknown"])
+
+        self.assertEqual(result, {"kept": videos, "removed": []})
+
+    def test_no_filters_keeps_everything(self):
+        videos = [_video("1", "Fan reaction")]
+
+        result = self.filter.apply_filters(videos, [])
+
+        self.assertEqual(result, {"kept": videos, "removed": []})
+        self.assertIsNot(result["kept"], videos)
+        self.assertNotIn("filter_reason", videos[0])
+
+
+class TestYouTubePostFilterDeduplicate(unittest.TestCase):
+    def test_keeps_first_occurrence_and_drops_missing_ids(self):
+        first = {"video_id": "a", "category": "tactical"}
+        videos = [
+            first,
+            {"video_id": "b"},
+            {"video_id": "a", "category": "historic"},
+            {"title": "no id"},
+        ]
+
+        unique = YouTubePostFilter().deduplicate(videos)
+
+        self.assertEqual([v.get("video_id") for v in unique], ["a", "b"])
+        self.assertIs(unique[0], first)
+
+
+class TestYouTubePostFilterSortTrusted(unittest.TestCase):
+    def test_trusted_channels_first_with_badge(self):
+        trusted_id, info = next(iter(TRUSTED_CHANNELS.items()))
+        videos = [
+            {"video_id": "a", "channel_id": "UCunknown", "channel_name": "Fan TV"},
+            {"video_id": "b", "channel_id": trusted_id},
+        ]
+
+        result = YouTubePostFilter().sort_trusted(videos)
+
+        self.assertEqual([v["video_id"] for v in result], ["b", "a"])
+        self.assertEqual(result[0]["channel_display"], f"✅ {info['name']}")
+        self.assertEqual(result[1]["channel_display"], "⚠️ Fan TV")
+        self.assertEqual([v["is_trusted"] for v in result], [True, False])
+
+
+class TestYouTubePostFilterPipeline(unittest.TestCase):
+    def test_deduplicates_then_filters_then_sorts_kept(self):
+        videos = [
+            _video("1", "Fan reaction"),
+            _video("2", "Training", "older"),
+            _video("1", "Fan reaction"),
+            _video("3", "Training", "newer"),
+        ]
+        videos[1]["published_at"] = "2025-01-01T00:00:00Z"
+        videos[3]["published_at"] = "2025-01-02T00:00:00Z"
+
+        result = YouTubePostFilter().filter_pipeline(videos, ["reaction"])
+
+        self.assertEqual([v["video_id"] for v in result["removed"]], ["1"])
+        self.assertEqual([v["video_id"] for v in result["kept"]], ["3", "2"])
+
+
+def _candidates(prefix: str, count: int = 4) -> list[dict]:
+    return [_video(f"{prefix}{i}", f"{prefix} video {i}") for i in range(count)]
+
+
+class TestYouTubePostFilterContextFilter(unittest.TestCase):
+    def test_fenced_llm_response_is_parsed(self):
+        gemini_client = MagicMock()
+        gemini_client.generate_content.return_value = (
+            '```json\n{"kept_indices": [1], "reasoning": "h2h"}\n```'
+        )
+
+        result = YouTubePostFilter().filter_by_context(
+            _candidates("a"), "Arsenal", "Spurs", gemini_client
+        )
+
+        self.assertEqual([v["video_id"] for v in result["kept"]], ["a1"])
+        self.assertEqual([v["video_id"] for v in result["removed"]], ["a0", "a2", "a3"])
+
+    def test_few_candidates_skip_llm(self):
+        gemini_client = MagicMock()
+        videos = _candidates("a", YouTubePostFilter.MIN_VIDEOS_FOR_LLM)
+
+        result = YouTubePostFilter().filter_by_context(
+            videos, "Arsenal", "Spurs", gemini_client
+        )
+
+        gemini_client.generate_content.assert_not_called()
+        self.assertEqual(result, {"kept": videos, "removed": []})
+
+    def test_only_first_candidates_go_to_llm_and_rest_are_kept(self):
+        gemini_client = MagicMock()
+        gemini_client.generate_content.return_value = '{"kept_indices": [0]}'
+        limit = YouTubePostFilter.MAX_VIDEOS_FOR_LLM
+        videos = _candidates("a", limit + 5)
+
+        result = YouTubePostFilter().filter_by_context(
+            videos, "Arsenal", "Spurs", gemini_client
+        )
+
+        gemini_client.generate_content.assert_called_once()
+        self.assertEqual(
+            [v["video_id"] for v in result["kept"]],
+            ["a0"] + [f"a{i}" for i in range(limit, limit + 5)],
+        )
+        self.assertEqual(len(result["removed"]), limit - 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+import unittest
+from datetime import UTC, datetime
+from unittest.mock import MagicMock, patch
+
+from config import config
+from settings.search_specs import YOUTUBE_SEARCH_SPECS, get_youtube_max_display
+from src.clients.http_client import HTTP_POOL_MAXSIZE
+from src.youtube_service import YouTubeService
+
+
+def _playlist_videos(channel_id, max_results=50, published_after=None, **kwargs):
+    window = published_after.strftime("%Y%m%d") if published_after else "nodate"
+    return [
+        {
+            "video_id": f"{channel_id}-{window}-{i}",
+            "title": "Arsenal Chelsea press conference Saka Palmer",
+            "channel_id": channel_id,
+            "published_at": f"2025-01-0{i + 1}T00:00:00Z",
+        }
+        for i in range(3)
+    ]
+
+
+def _match():
+    match = MagicMock()
+    match.core.home_team = "Arsenal"
+    match.core.away_team = "Chelsea"
+    match.core.kickoff_at_utc = datetime(2025, 1, 10, tzinfo=UTC)
+    match.facts.home_manager = "Arteta"
+    match.facts.away_manager = "Maresca"
+    match.facts.home_lineup = ["Saka"]
+    match.facts.away_lineup = ["Palmer"]
+    return match
+
+
+class TestYouTubeServiceGetVideosForMatch(unittest.TestCase):
+    def test_kept_videos_are_grouped_and_capped_per_category(self):
+        youtube_client = MagicMock()
+        youtube_client.get_channel_playlist_videos.side_effect = _playlist_videos
+        youtube_client.search.return_value = []
+        service = YouTubeService(youtube_client=youtube_client)
+
+        result = service.get_videos_for_match(_match())
+
+        kept_categories = [v["category"] for v in result["kept"]]
+        self.assertEqual(
+            kept_categories,
+            sorted(kept_categories, key=YouTubeService.CATEGORIES.index),
+        )
+        for category in set(kept_categories):
+            cat_kept = [v for v in result["kept"] if v["category"] == category]
+            cat_overflow = [v for v in result["overflow"] if v["category"] == category]
+            self.assertLessEqual(len(cat_kept), get_youtube_max_display(category))
+            if cat_overflow:
+                self.assertGreaterEqual(
+                    min(v["published_at"] for v in cat_kept),
+                    max(v["published_at"] for v in cat_overflow),
+                )
+
+        video_ids = [v["video_id"] for v in result["kept"] + result["overflow"]]
+        self.assertEqual(len(video_ids), len(set(video_ids)))
+
+
+class TestYouTubeServiceHistoricClashes(unittest.TestCase):
+    def test_split_window_searches_each_bin_and_dedupes(self):
+        video = {
+            "video_id": "v1",
+            "title": "Arsenal vs Chelsea highlights",
+            "channel_id": "",
+        }
+        youtube_client = MagicMock()
+        youtube_client.search.side_effect = lambda *args, **kwargs: [dict(video)]
+        service = YouTubeService(youtube_client=youtube_client)
+        kickoff = datetime(2025, 1, 10, tzinfo=UTC)
+
+        with patch.dict(YOUTUBE_SEARCH_SPECS["historic"]["window"], {"bins": 4}):
+            result = service._search_historic_clashes("Arsenal", "Chelsea", kickoff)
+
+        self.assertEqual(youtube_client.search.call_count, 4)
+        windows = sorted(
+            (c.kwargs["published_after"], c.kwargs["published_before"])
+            for c in youtube_client.search.call_args_list
+        )
+        for (_, before), (after, _) in zip(windows, windows[1:]):
+            self.assertEqual(before, after)
+        videos = result["kept"] + result["removed"]
+        self.assertEqual([v["video_id"] for v in videos], ["v1"])
+
+
+class TestYouTubeServiceKeyPlayers(unittest.TestCase):
+    def test_takes_players_from_the_end_of_the_lineup(self):
+        match = MagicMock()
+        match.facts.home_lineup = ["GK", "DF", "MF", "FW1", "FW2"]
+        match.facts.away_lineup = []
+        service = YouTubeService(youtube_client=MagicMock())
+
+        with patch.object(config, "DEBUG_MODE", False):
+            home_players, away_players = service._get_key_players(match)
+
+        self.assertEqual(home_players, ["FW2", "FW1", "MF"])
+        self.assertEqual(away_players, [])
+
+
+class TestYouTubeServiceProcessMatches(unittest.TestCase):
+    def test_concurrent_searches_fit_in_connection_pool(self):
+        self.assertGreaterEqual(YouTubeService.MAX_MATCH_WORKERS, 1)
+        self.assertLessEqual(
+            YouTubeService.MAX_MATCH_WORKERS * YouTubeService.MAX_SEARCH_WORKERS,
+            HTTP_POOL_MAXSIZE,
+        )
+
+    def test_target_matches_keep_input_order_and_skip_low_rank(self):
+        matches = []
+        for home, rank in [("Arsenal", "S"), ("Leeds", "C"), ("Fulham", "A")]:
+            match = MagicMock()
+            match.core.is_target = True
+            match.core.rank = rank
+            match.core.home_team = home
+            match.core.away_team = "Chelsea"
+            matches.append(match)
+        service = YouTubeService(youtube_client=MagicMock())
+
+        with (
+            patch.object(config, "USE_MOCK_DATA", False),
+            patch.object(
+                service,
+                "get_videos_for_match",
+                side_effect=lambda m: {"kept": [m.core.home_team]},
+            ),
+        ):
+            results = service.process_matches(matches)
+
+        self.assertEqual(list(results), ["Arsenal vs Chelsea", "Fulham vs Chelsea"])
+        self.assertEqual(results["Fulham vs Chelsea"], {"kept": ["Fulham"]})
+
+
+if __name__ == "__main__":
+    unittest.main()